@@ -37,7 +37,7 @@ async def _get_browser_component(context: ContextWrapper[AstrAgentContext]) -> A
     return browser
 
 
-@dataclass
+@dataclass(slots=True)
 class BrowserExecTool(FunctionTool):
     name: str = "astrbot_execute_browser"
     description: str = "Execute one browser automation command in the sandbox."
@@ -94,7 +94,7 @@ class BrowserExecTool(FunctionTool):
             return f"Error executing browser command: {str(e)}"
 
 
-@dataclass
+@dataclass(slots=True)
 class BrowserBatchExecTool(FunctionTool):
     name: str = "astrbot_execute_browser_batch"
     description: str = "Execute a browser command batch in the sandbox."
@@ -158,7 +158,7 @@ class BrowserBatchExecTool(FunctionTool):
             return f"Error executing browser batch command: {str(e)}"
 
 
-@dataclass
+@dataclass(slots=True)
 class RunBrowserSkillTool(FunctionTool):
     name: str = "astrbot_run_browser_skill"
     description: str = "Run a released browser skill in the sandbox by skill_key."
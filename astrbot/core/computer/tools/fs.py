@@ -77,7 +77,7 @@ from .permissions import check_admin_permission
 #             return f"Error reading file: {str(e)}"
 
 
-@dataclass
+@dataclass(slots=True)
 class FileUploadTool(FunctionTool):
     name: str = "astrbot_upload_file"
     description: str = "Upload a local file to the sandbox. The file must exist on the local filesystem."
@@ -137,7 +137,7 @@ class FileUploadTool(FunctionTool):
             return f"Error uploading file: {str(e)}"
 
 
-@dataclass
+@dataclass(slots=True)
 class FileDownloadTool(FunctionTool):
     name: str = "astrbot_download_file"
     description: str = "Download a file from the sandbox. Only call this when user explicitly need you to download a file."
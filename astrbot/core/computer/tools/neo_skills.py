@@ -1,7 +1,18 @@
+import asyncio
+import functools
 import json
+import operator
 from collections.abc import Awaitable, Callable
 from dataclasses import dataclass, field
-from typing import Any
+from datetime import date, datetime
+from decimal import Decimal
+from typing import Any, Final
+from uuid import UUID
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - optional accelerator
+    orjson = None
 
 from astrbot.api import FunctionTool
 from astrbot.core.agent.run_context import ContextWrapper
@@ -9,47 +20,115 @@ from astrbot.core.agent.tool import ToolExecResult
 from astrbot.core.astr_agent_context import AstrAgentContext
 from astrbot.core.skills.neo_skill_sync import NeoSkillSyncManager
 
-from ..computer_client import get_booter
+from ..computer_client import get_booter, session_booter
 
 
 def _to_jsonable(model_like: Any) -> Any:
-    if isinstance(model_like, dict):
+    tp = type(model_like)
+    if tp is dict or tp is list or isinstance(model_like, (dict, list)):
         return model_like
-    if isinstance(model_like, list):
-        return [_to_jsonable(i) for i in model_like]
-    if hasattr(model_like, "model_dump"):
-        return _to_jsonable(model_like.model_dump())
+    dump = getattr(model_like, "model_dump", None)
+    if dump is not None:
+        return dump()
     return model_like
 
 
+_JSON_DEFAULT_DISPATCH: Final[dict] = {
+    datetime: datetime.isoformat,
+    date: date.isoformat,
+    UUID: str,
+    Decimal: str,
+}
+
+
+def _json_default(obj: Any) -> Any:
+    handler = _JSON_DEFAULT_DISPATCH.get(type(obj))
+    if handler is not None:
+        return handler(obj)
+    dump = getattr(obj, "model_dump", None)
+    if dump is not None:
+        return dump()
+    return str(obj)
+
+
 def _to_json_text(data: Any) -> str:
-    return json.dumps(_to_jsonable(data), ensure_ascii=False, default=str)
+    if orjson is not None:
+        return orjson.dumps(data, default=_json_default).decode()
+    return json.dumps(data, ensure_ascii=False, default=_json_default)
+
+
+_ADMIN_DENIED: Final[str] = (
+    "error: Permission denied. Skill lifecycle tools are only allowed for admin users."
+)
+
+
+def _admin_only(fn: Callable[..., Awaitable[ToolExecResult]]):
+    """Short-circuit a tool ``call``/``_run`` for non-admin users.
+
+    The denial string is a module constant, so the rejected path allocates
+    no coroutine frame beyond the wrapper itself.
+    """
+
+    @functools.wraps(fn)
+    async def wrapper(self, context: ContextWrapper[AstrAgentContext], **kwargs):
+        if context.context.event.role != "admin":
+            return _ADMIN_DENIED
+        return await fn(self, context, **kwargs)
+
+    return wrapper
+
+
+_ERR_PROMOTE: Final[str] = "Error promoting skill candidate: "
+
+_SYNC_MGR: NeoSkillSyncManager | None = None
+
 
+def _sync_mgr() -> NeoSkillSyncManager:
+    global _SYNC_MGR
+    if _SYNC_MGR is None:
+        _SYNC_MGR = NeoSkillSyncManager()
+    return _SYNC_MGR
 
-def _ensure_admin(context: ContextWrapper[AstrAgentContext]) -> str | None:
-    if context.context.event.role != "admin":
-        return "error: Permission denied. Skill lifecycle tools are only allowed for admin users."
-    return None
+
+_NEO_CONTEXT_CACHE_MAX = 64
+
+_neo_context_cache: dict[str, tuple[Any, Any, Any]] = {}
+"""unified_msg_origin -> (booter, client, sandbox), valid while the booter is registered."""
 
 
 async def _get_neo_context(
     context: ContextWrapper[AstrAgentContext],
 ) -> tuple[Any, Any]:
-    booter = await get_booter(
-        context.context.context,
-        context.context.event.unified_msg_origin,
-    )
-    client = getattr(booter, "bay_client", None)
-    sandbox = getattr(booter, "sandbox", None)
+    umo = context.context.event.unified_msg_origin
+    cached = _neo_context_cache.get(umo)
+    if cached is not None:
+        if session_booter.get(umo) is cached[0]:
+            return cached[1], cached[2]
+        # The session's booter changed or was torn down; drop the stale
+        # entry so dead booter/client/sandbox triples don't accumulate.
+        _neo_context_cache.pop(umo, None)
+    booter = await get_booter(context.context.context, umo)
+    try:
+        client = booter.bay_client
+        sandbox = booter.sandbox
+    except AttributeError:
+        client = sandbox = None
     if client is None or sandbox is None:
         raise RuntimeError(
             "Current sandbox booter does not support Neo skill lifecycle APIs. "
             "Please switch to shipyard_neo."
         )
+    _neo_context_cache[umo] = (booter, client, sandbox)
+    while len(_neo_context_cache) > _NEO_CONTEXT_CACHE_MAX:
+        _neo_context_cache.pop(next(iter(_neo_context_cache)))
     return client, sandbox
 
 
-@dataclass
+def _invalidate_neo_context(context: ContextWrapper[AstrAgentContext]) -> None:
+    _neo_context_cache.pop(context.context.event.unified_msg_origin, None)
+
+
+@dataclass(slots=True)
 class NeoSkillToolBase(FunctionTool):
     error_prefix: str = "Error"
 
@@ -57,331 +136,340 @@ class NeoSkillToolBase(FunctionTool):
         self,
         context: ContextWrapper[AstrAgentContext],
         neo_call: Callable[[Any, Any], Awaitable[Any]],
-        error_action: str,
+        error_text: str,
     ) -> ToolExecResult:
-        if err := _ensure_admin(context):
-            return err
         try:
             client, sandbox = await _get_neo_context(context)
             result = await neo_call(client, sandbox)
             return _to_json_text(result)
         except Exception as e:
-            return f"{self.error_prefix} {error_action}: {str(e)}"
-
-
-@dataclass
-class GetExecutionHistoryTool(NeoSkillToolBase):
-    name: str = "astrbot_get_execution_history"
-    description: str = "Get execution history from current sandbox."
-    parameters: dict = field(
-        default_factory=lambda: {
-            "type": "object",
-            "properties": {
-                "exec_type": {"type": "string"},
-                "success_only": {"type": "boolean", "default": False},
-                "limit": {"type": "integer", "default": 100},
-                "offset": {"type": "integer", "default": 0},
-                "tags": {"type": "string"},
-                "has_notes": {"type": "boolean", "default": False},
-                "has_description": {"type": "boolean", "default": False},
-            },
-            "required": [],
-        }
-    )
-
-    async def call(
-        self,
-        context: ContextWrapper[AstrAgentContext],
-        exec_type: str | None = None,
-        success_only: bool = False,
-        limit: int = 100,
-        offset: int = 0,
-        tags: str | None = None,
-        has_notes: bool = False,
-        has_description: bool = False,
-    ) -> ToolExecResult:
-        return await self._run(
-            context,
-            lambda _client, sandbox: sandbox.get_execution_history(
-                exec_type=exec_type,
-                success_only=success_only,
-                limit=limit,
-                offset=offset,
-                tags=tags,
-                has_notes=has_notes,
-                has_description=has_description,
-            ),
-            error_action="getting execution history",
-        )
-
+            _invalidate_neo_context(context)
+            return error_text + str(e)
 
-@dataclass
-class AnnotateExecutionTool(NeoSkillToolBase):
-    name: str = "astrbot_annotate_execution"
-    description: str = "Annotate one execution history record."
-    parameters: dict = field(
-        default_factory=lambda: {
-            "type": "object",
-            "properties": {
-                "execution_id": {"type": "string"},
-                "description": {"type": "string"},
-                "tags": {"type": "string"},
-                "notes": {"type": "string"},
-            },
-            "required": ["execution_id"],
-        }
-    )
-
-    async def call(
-        self,
-        context: ContextWrapper[AstrAgentContext],
-        execution_id: str,
-        description: str | None = None,
-        tags: str | None = None,
-        notes: str | None = None,
-    ) -> ToolExecResult:
-        return await self._run(
-            context,
-            lambda _client, sandbox: sandbox.annotate_execution(
-                execution_id=execution_id,
-                description=description,
-                tags=tags,
-                notes=notes,
-            ),
-            error_action="annotating execution",
-        )
-
-
-@dataclass
-class CreateSkillPayloadTool(NeoSkillToolBase):
-    name: str = "astrbot_create_skill_payload"
-    description: str = (
-        "Step 1/3 for Neo skill authoring: create immutable payload content and return payload_ref. "
-        "Use this to store skill_markdown and structured metadata; do NOT write local skill folders directly."
-    )
-    parameters: dict = field(
-        default_factory=lambda: {
-            "type": "object",
-            "properties": {
-                "payload": {
-                    "anyOf": [{"type": "object"}, {"type": "array"}],
-                    "description": (
-                        "Skill payload JSON. Typical schema: {skill_markdown, inputs, outputs, meta}. "
-                        "This only stores content and returns payload_ref; it does not create a candidate or release."
-                    ),
-                },
-                "kind": {
-                    "type": "string",
-                    "description": "Payload kind.",
-                    "default": "astrbot_skill_v1",
-                },
-            },
-            "required": ["payload"],
-        }
-    )
-
-    async def call(
-        self,
-        context: ContextWrapper[AstrAgentContext],
-        payload: dict[str, Any] | list[Any],
-        kind: str = "astrbot_skill_v1",
-    ) -> ToolExecResult:
-        return await self._run(
-            context,
-            lambda client, _sandbox: client.skills.create_payload(
-                payload=payload,
-                kind=kind,
-            ),
-            error_action="creating skill payload",
-        )
 
+@dataclass(slots=True)
+class NeoSkillTool(NeoSkillToolBase):
+    """Generic Neo skill tool that dispatches to a declarative target.
 
-@dataclass
-class GetSkillPayloadTool(NeoSkillToolBase):
-    name: str = "astrbot_get_skill_payload"
-    description: str = "Get one skill payload by payload_ref."
-    parameters: dict = field(
-        default_factory=lambda: {
-            "type": "object",
-            "properties": {
-                "payload_ref": {"type": "string"},
-            },
-            "required": ["payload_ref"],
-        }
-    )
+    ``target`` is either a dotted path rooted at ``client``/``sandbox``
+    (e.g. ``client.skills.create_payload``) or the name of a module-level
+    coroutine function called as ``fn(client, sandbox, **kwargs)``.
+    """
 
-    async def call(
-        self,
-        context: ContextWrapper[AstrAgentContext],
-        payload_ref: str,
-    ) -> ToolExecResult:
-        return await self._run(
-            context,
-            lambda client, _sandbox: client.skills.get_payload(payload_ref),
-            error_action="getting skill payload",
-        )
+    target: str = ""
+    error_action: str = ""
+    _error_text: str = field(init=False, default="")
 
+    def __post_init__(self) -> None:
+        self._error_text = f"{self.error_prefix} {self.error_action}: "
 
-@dataclass
-class CreateSkillCandidateTool(NeoSkillToolBase):
-    name: str = "astrbot_create_skill_candidate"
-    description: str = (
-        "Step 2/3 for Neo skill authoring: create a candidate by binding execution evidence "
-        "(source_execution_ids) with skill identity (skill_key) and optional payload_ref."
-    )
-    parameters: dict = field(
-        default_factory=lambda: {
-            "type": "object",
-            "properties": {
-                "skill_key": {
-                    "type": "string",
-                    "description": "Stable logical identifier, e.g. image-collage-9grid.",
-                },
-                "source_execution_ids": {
-                    "type": "array",
-                    "items": {"type": "string"},
-                    "description": "Execution evidence IDs captured from sandbox history.",
-                },
-                "scenario_key": {
-                    "type": "string",
-                    "description": "Optional scenario namespace for grouping candidates.",
-                },
-                "payload_ref": {
-                    "type": "string",
-                    "description": "Optional payload reference created by astrbot_create_skill_payload.",
-                },
-            },
-            "required": ["skill_key", "source_execution_ids"],
-        }
-    )
+    def _resolve_call(
+        self, client: Any, sandbox: Any, kwargs: dict[str, Any]
+    ) -> Awaitable[Any]:
+        root, _, attr_path = self.target.partition(".")
+        if root == "client":
+            return operator.attrgetter(attr_path)(client)(**kwargs)
+        if root == "sandbox":
+            return operator.attrgetter(attr_path)(sandbox)(**kwargs)
+        return globals()[self.target](client, sandbox, **kwargs)
 
+    @_admin_only
     async def call(
         self,
         context: ContextWrapper[AstrAgentContext],
-        skill_key: str,
-        source_execution_ids: list[str],
-        scenario_key: str | None = None,
-        payload_ref: str | None = None,
+        **kwargs,
     ) -> ToolExecResult:
         return await self._run(
             context,
-            lambda client, _sandbox: client.skills.create_candidate(
-                skill_key=skill_key,
-                source_execution_ids=source_execution_ids,
-                scenario_key=scenario_key,
-                payload_ref=payload_ref,
-            ),
-            error_action="creating skill candidate",
+            lambda client, sandbox: self._resolve_call(client, sandbox, kwargs),
+            error_text=self._error_text,
         )
 
 
-@dataclass
-class ListSkillCandidatesTool(NeoSkillToolBase):
-    name: str = "astrbot_list_skill_candidates"
-    description: str = "List skill candidates."
-    parameters: dict = field(
-        default_factory=lambda: {
-            "type": "object",
-            "properties": {
-                "status": {"type": "string"},
-                "skill_key": {"type": "string"},
-                "limit": {"type": "integer", "default": 100},
-                "offset": {"type": "integer", "default": 0},
-            },
-            "required": [],
-        }
-    )
-
-    async def call(
-        self,
-        context: ContextWrapper[AstrAgentContext],
-        status: str | None = None,
-        skill_key: str | None = None,
-        limit: int = 100,
-        offset: int = 0,
-    ) -> ToolExecResult:
-        return await self._run(
-            context,
-            lambda client, _sandbox: client.skills.list_candidates(
-                status=status,
-                skill_key=skill_key,
-                limit=limit,
-                offset=offset,
+def _object_schema(properties: dict, required: tuple[str, ...] = ()) -> dict:
+    """Build one JSON-schema object node; leaves should reuse the shared params."""
+    return {"type": "object", "properties": properties, "required": list(required)}
+
+
+_STR_PARAM: Final[dict] = {"type": "string"}
+_BOOL_FALSE_PARAM: Final[dict] = {"type": "boolean", "default": False}
+_LIMIT_PARAM: Final[dict] = {"type": "integer", "default": 100}
+_OFFSET_PARAM: Final[dict] = {"type": "integer", "default": 0}
+
+_PARAMS_GET_EXECUTION_HISTORY: Final[dict] = _object_schema(
+    {
+        "exec_type": _STR_PARAM,
+        "success_only": _BOOL_FALSE_PARAM,
+        "limit": _LIMIT_PARAM,
+        "offset": _OFFSET_PARAM,
+        "tags": _STR_PARAM,
+        "has_notes": _BOOL_FALSE_PARAM,
+        "has_description": _BOOL_FALSE_PARAM,
+    },
+)
+
+_PARAMS_ANNOTATE_EXECUTION: Final[dict] = _object_schema(
+    {
+        "execution_id": _STR_PARAM,
+        "description": _STR_PARAM,
+        "tags": _STR_PARAM,
+        "notes": _STR_PARAM,
+    },
+    required=("execution_id",),
+)
+
+_PARAMS_CREATE_SKILL_PAYLOAD: Final[dict] = _object_schema(
+    {
+        "payload": {
+            "anyOf": [{"type": "object"}, {"type": "array"}],
+            "description": (
+                "Skill payload JSON. Typical schema: {skill_markdown, inputs, outputs, meta}. "
+                "This only stores content and returns payload_ref; it does not create a candidate or release."
             ),
-            error_action="listing skill candidates",
-        )
-
-
-@dataclass
-class EvaluateSkillCandidateTool(NeoSkillToolBase):
-    name: str = "astrbot_evaluate_skill_candidate"
-    description: str = "Evaluate a skill candidate."
-    parameters: dict = field(
-        default_factory=lambda: {
-            "type": "object",
-            "properties": {
-                "candidate_id": {"type": "string"},
-                "passed": {"type": "boolean"},
-                "score": {"type": "number"},
-                "benchmark_id": {"type": "string"},
-                "report": {"type": "string"},
-            },
-            "required": ["candidate_id", "passed"],
-        }
-    )
-
-    async def call(
-        self,
-        context: ContextWrapper[AstrAgentContext],
-        candidate_id: str,
-        passed: bool,
-        score: float | None = None,
-        benchmark_id: str | None = None,
-        report: str | None = None,
-    ) -> ToolExecResult:
-        return await self._run(
-            context,
-            lambda client, _sandbox: client.skills.evaluate_candidate(
-                candidate_id,
-                passed=passed,
-                score=score,
-                benchmark_id=benchmark_id,
-                report=report,
+        },
+        "kind": {
+            "type": "string",
+            "description": "Payload kind.",
+            "default": "astrbot_skill_v1",
+        },
+    },
+    required=("payload",),
+)
+
+_PARAMS_GET_SKILL_PAYLOAD: Final[dict] = _object_schema(
+    {
+        "payload_ref": _STR_PARAM,
+    },
+    required=("payload_ref",),
+)
+
+_PARAMS_CREATE_SKILL_CANDIDATE: Final[dict] = _object_schema(
+    {
+        "skill_key": {
+            "type": "string",
+            "description": "Stable logical identifier, e.g. image-collage-9grid.",
+        },
+        "source_execution_ids": {
+            "type": "array",
+            "items": _STR_PARAM,
+            "description": "Execution evidence IDs captured from sandbox history.",
+        },
+        "scenario_key": {
+            "type": "string",
+            "description": "Optional scenario namespace for grouping candidates.",
+        },
+        "payload_ref": {
+            "type": "string",
+            "description": "Optional payload reference created by astrbot_create_skill_payload.",
+        },
+    },
+    required=(
+        "skill_key",
+        "source_execution_ids",
+    ),
+)
+
+_PARAMS_LIST_SKILL_CANDIDATES: Final[dict] = _object_schema(
+    {
+        "status": _STR_PARAM,
+        "skill_key": _STR_PARAM,
+        "limit": _LIMIT_PARAM,
+        "offset": _OFFSET_PARAM,
+    },
+)
+
+_PARAMS_EVALUATE_SKILL_CANDIDATE: Final[dict] = _object_schema(
+    {
+        "candidate_id": _STR_PARAM,
+        "passed": {"type": "boolean"},
+        "score": {"type": "number"},
+        "benchmark_id": _STR_PARAM,
+        "report": _STR_PARAM,
+    },
+    required=(
+        "candidate_id",
+        "passed",
+    ),
+)
+
+_PARAMS_LIST_SKILL_RELEASES: Final[dict] = _object_schema(
+    {
+        "skill_key": _STR_PARAM,
+        "active_only": _BOOL_FALSE_PARAM,
+        "stage": _STR_PARAM,
+        "limit": _LIMIT_PARAM,
+        "offset": _OFFSET_PARAM,
+    },
+)
+
+_PARAMS_ROLLBACK_SKILL_RELEASE: Final[dict] = _object_schema(
+    {
+        "release_id": _STR_PARAM,
+    },
+    required=("release_id",),
+)
+
+_PARAMS_PROMOTE_SKILL_CANDIDATE: Final[dict] = _object_schema(
+    {
+        "candidate_id": _STR_PARAM,
+        "stage": {
+            "type": "string",
+            "description": "Release stage: canary/stable",
+            "default": "canary",
+        },
+        "sync_to_local": {
+            "type": "boolean",
+            "description": (
+                "Only used with stage=stable. true means sync payload.skill_markdown to local SKILL.md; "
+                "false means release remains Neo-side only."
             ),
-            error_action="evaluating skill candidate",
-        )
-
-
-@dataclass
+            "default": True,
+        },
+    },
+    required=("candidate_id",),
+)
+
+_PARAMS_SYNC_SKILL_RELEASE: Final[dict] = _object_schema(
+    {
+        "release_id": _STR_PARAM,
+        "skill_key": _STR_PARAM,
+        "require_stable": {"type": "boolean", "default": True},
+    },
+)
+
+# (class_name, tool_name, target, description, parameters, error_action)
+_TOOL_SPECS: Final[tuple[tuple[str, str, str, str, dict, str], ...]] = (
+    (
+        "GetExecutionHistoryTool",
+        "astrbot_get_execution_history",
+        "_get_execution_history",
+        "Get execution history from current sandbox.",
+        _PARAMS_GET_EXECUTION_HISTORY,
+        "getting execution history",
+    ),
+    (
+        "AnnotateExecutionTool",
+        "astrbot_annotate_execution",
+        "sandbox.annotate_execution",
+        "Annotate one execution history record.",
+        _PARAMS_ANNOTATE_EXECUTION,
+        "annotating execution",
+    ),
+    (
+        "CreateSkillPayloadTool",
+        "astrbot_create_skill_payload",
+        "client.skills.create_payload",
+        (
+            "Step 1/3 for Neo skill authoring: create immutable payload content and return payload_ref. "
+            "Use this to store skill_markdown and structured metadata; do NOT write local skill folders directly."
+        ),
+        _PARAMS_CREATE_SKILL_PAYLOAD,
+        "creating skill payload",
+    ),
+    (
+        "GetSkillPayloadTool",
+        "astrbot_get_skill_payload",
+        "client.skills.get_payload",
+        "Get one skill payload by payload_ref.",
+        _PARAMS_GET_SKILL_PAYLOAD,
+        "getting skill payload",
+    ),
+    (
+        "CreateSkillCandidateTool",
+        "astrbot_create_skill_candidate",
+        "client.skills.create_candidate",
+        (
+            "Step 2/3 for Neo skill authoring: create a candidate by binding execution evidence "
+            "(source_execution_ids) with skill identity (skill_key) and optional payload_ref."
+        ),
+        _PARAMS_CREATE_SKILL_CANDIDATE,
+        "creating skill candidate",
+    ),
+    (
+        "ListSkillCandidatesTool",
+        "astrbot_list_skill_candidates",
+        "client.skills.list_candidates",
+        "List skill candidates.",
+        _PARAMS_LIST_SKILL_CANDIDATES,
+        "listing skill candidates",
+    ),
+    (
+        "EvaluateSkillCandidateTool",
+        "astrbot_evaluate_skill_candidate",
+        "client.skills.evaluate_candidate",
+        "Evaluate a skill candidate.",
+        _PARAMS_EVALUATE_SKILL_CANDIDATE,
+        "evaluating skill candidate",
+    ),
+    (
+        "ListSkillReleasesTool",
+        "astrbot_list_skill_releases",
+        "client.skills.list_releases",
+        "List skill releases.",
+        _PARAMS_LIST_SKILL_RELEASES,
+        "listing skill releases",
+    ),
+    (
+        "RollbackSkillReleaseTool",
+        "astrbot_rollback_skill_release",
+        "_rollback_release",
+        "Rollback one skill release.",
+        _PARAMS_ROLLBACK_SKILL_RELEASE,
+        "rolling back skill release",
+    ),
+    (
+        "SyncSkillReleaseTool",
+        "astrbot_sync_skill_release",
+        "_sync_release_to_dict",
+        "Sync stable Neo release payload to local SKILL.md and update mapping metadata.",
+        _PARAMS_SYNC_SKILL_RELEASE,
+        "syncing skill release",
+    ),
+)
+
+
+def _make_tool_class(
+    cls_name: str,
+    tool_name: str,
+    target: str,
+    description: str,
+    parameters: dict,
+    error_action: str,
+) -> type[NeoSkillTool]:
+    namespace = {
+        "__module__": __name__,
+        "__qualname__": cls_name,
+        "__annotations__": {
+            "name": str,
+            "description": str,
+            "parameters": dict,
+            "target": str,
+            "error_action": str,
+        },
+        "name": tool_name,
+        "description": description,
+        "parameters": field(default_factory=lambda p=parameters: p),
+        "target": target,
+        "error_action": error_action,
+    }
+    return dataclass(slots=True)(type(cls_name, (NeoSkillTool,), namespace))
+
+
+for _spec in _TOOL_SPECS:
+    globals()[_spec[0]] = _make_tool_class(*_spec)
+del _spec
+
+
+@dataclass(slots=True)
 class PromoteSkillCandidateTool(NeoSkillToolBase):
     name: str = "astrbot_promote_skill_candidate"
     description: str = (
         "Step 3/3 for Neo skill authoring: promote candidate to canary/stable release. "
         "If stage=stable and sync_to_local=true, payload.skill_markdown is synced to local SKILL.md automatically."
     )
-    parameters: dict = field(
-        default_factory=lambda: {
-            "type": "object",
-            "properties": {
-                "candidate_id": {"type": "string"},
-                "stage": {
-                    "type": "string",
-                    "description": "Release stage: canary/stable",
-                    "default": "canary",
-                },
-                "sync_to_local": {
-                    "type": "boolean",
-                    "description": (
-                        "Only used with stage=stable. true means sync payload.skill_markdown to local SKILL.md; "
-                        "false means release remains Neo-side only."
-                    ),
-                    "default": True,
-                },
-            },
-            "required": ["candidate_id"],
-        }
-    )
+    parameters: dict = field(default_factory=lambda: _PARAMS_PROMOTE_SKILL_CANDIDATE)
 
+    @_admin_only
     async def call(
         self,
         context: ContextWrapper[AstrAgentContext],
@@ -389,15 +477,12 @@ class PromoteSkillCandidateTool(NeoSkillToolBase):
         stage: str = "canary",
         sync_to_local: bool = True,
     ) -> ToolExecResult:
-        if err := _ensure_admin(context):
-            return err
         if stage not in {"canary", "stable"}:
-            return "Error promoting skill candidate: stage must be canary or stable."
+            return _ERR_PROMOTE + "stage must be canary or stable."
 
         try:
             client, _sandbox = await _get_neo_context(context)
-            sync_mgr = NeoSkillSyncManager()
-            result = await sync_mgr.promote_with_optional_sync(
+            result = await _sync_mgr().promote_with_optional_sync(
                 client,
                 candidate_id=candidate_id,
                 stage=stage,
@@ -406,10 +491,15 @@ class PromoteSkillCandidateTool(NeoSkillToolBase):
             if result.get("sync_error"):
                 rollback_json = result.get("rollback")
                 if rollback_json:
-                    return (
-                        "Error promoting skill candidate: stable release synced failed; "
-                        f"auto rollback succeeded. sync_error={result['sync_error']}; "
-                        f"rollback={_to_json_text(rollback_json)}"
+                    return _to_json_text(
+                        {
+                            "status": "error",
+                            "reason": (
+                                "stable release synced failed; auto rollback succeeded"
+                            ),
+                            "sync_error": result["sync_error"],
+                            "rollback": rollback_json,
+                        }
                     )
             return _to_json_text(
                 {
@@ -419,120 +509,81 @@ class PromoteSkillCandidateTool(NeoSkillToolBase):
                 }
             )
         except Exception as e:
-            return f"Error promoting skill candidate: {str(e)}"
-
-
-@dataclass
-class ListSkillReleasesTool(NeoSkillToolBase):
-    name: str = "astrbot_list_skill_releases"
-    description: str = "List skill releases."
-    parameters: dict = field(
-        default_factory=lambda: {
-            "type": "object",
-            "properties": {
-                "skill_key": {"type": "string"},
-                "active_only": {"type": "boolean", "default": False},
-                "stage": {"type": "string"},
-                "limit": {"type": "integer", "default": 100},
-                "offset": {"type": "integer", "default": 0},
-            },
-            "required": [],
-        }
-    )
-
-    async def call(
-        self,
-        context: ContextWrapper[AstrAgentContext],
-        skill_key: str | None = None,
-        active_only: bool = False,
-        stage: str | None = None,
-        limit: int = 100,
-        offset: int = 0,
-    ) -> ToolExecResult:
-        return await self._run(
-            context,
-            lambda client, _sandbox: client.skills.list_releases(
-                skill_key=skill_key,
-                active_only=active_only,
-                stage=stage,
-                limit=limit,
-                offset=offset,
-            ),
-            error_action="listing skill releases",
-        )
-
+            _invalidate_neo_context(context)
+            return _ERR_PROMOTE + str(e)
 
-@dataclass
-class RollbackSkillReleaseTool(NeoSkillToolBase):
-    name: str = "astrbot_rollback_skill_release"
-    description: str = "Rollback one skill release."
-    parameters: dict = field(
-        default_factory=lambda: {
-            "type": "object",
-            "properties": {
-                "release_id": {"type": "string"},
-            },
-            "required": ["release_id"],
-        }
-    )
 
-    async def call(
-        self,
-        context: ContextWrapper[AstrAgentContext],
-        release_id: str,
-    ) -> ToolExecResult:
-        return await self._run(
-            context,
-            lambda client, _sandbox: client.skills.rollback_release(release_id),
-            error_action="rolling back skill release",
-        )
+_HISTORY_FANOUT_LIMIT = 8
 
 
-@dataclass
-class SyncSkillReleaseTool(NeoSkillToolBase):
-    name: str = "astrbot_sync_skill_release"
-    description: str = (
-        "Sync stable Neo release payload to local SKILL.md and update mapping metadata."
-    )
-    parameters: dict = field(
-        default_factory=lambda: {
-            "type": "object",
-            "properties": {
-                "release_id": {"type": "string"},
-                "skill_key": {"type": "string"},
-                "require_stable": {"type": "boolean", "default": True},
-            },
-            "required": [],
-        }
+async def _get_execution_history(
+    client: Any,
+    sandbox: Any,
+    *,
+    tags: str | None = None,
+    **kwargs,
+) -> Any:
+    """Fetch execution history, fanning out per tag for multi-tag queries."""
+    _ = client
+    tag_list = [t.strip() for t in tags.split(",") if t.strip()] if tags else []
+    if len(tag_list) <= 1:
+        return await sandbox.get_execution_history(tags=tags, **kwargs)
+
+    sem = asyncio.Semaphore(_HISTORY_FANOUT_LIMIT)
+
+    async def _one(tag: str) -> Any:
+        async with sem:
+            return await sandbox.get_execution_history(tags=tag, **kwargs)
+
+    pages = await asyncio.gather(*(_one(tag) for tag in tag_list))
+    limit = kwargs.get("limit")
+    merged: list[Any] = []
+    seen: set[Any] = set()
+    for page in pages:
+        page_json = _to_jsonable(page)
+        items = page_json.get("items", []) if isinstance(page_json, dict) else []
+        for item in items:
+            key = item.get("id") if isinstance(item, dict) else None
+            if key is not None:
+                if key in seen:
+                    continue
+                seen.add(key)
+            merged.append(item)
+            if limit is not None and len(merged) >= limit:
+                return {"items": merged, "total": len(merged)}
+    return {"items": merged, "total": len(merged)}
+
+
+async def _rollback_release(
+    client: Any,
+    sandbox: Any,
+    *,
+    release_id: str,
+) -> Any:
+    _ = sandbox
+    result = await client.skills.rollback_release(release_id)
+    # A rollback changes which release is active for this skill; drop
+    # cached lookups that could now report a stale stage.
+    result_json = _to_jsonable(result)
+    _sync_mgr().invalidate_release_cache(
+        release_id=str(release_id),
+        skill_key=result_json.get("skill_key")
+        if isinstance(result_json, dict)
+        else None,
     )
-
-    async def call(
-        self,
-        context: ContextWrapper[AstrAgentContext],
-        release_id: str | None = None,
-        skill_key: str | None = None,
-        require_stable: bool = True,
-    ) -> ToolExecResult:
-        return await self._run(
-            context,
-            lambda client, _sandbox: _sync_release_to_dict(
-                client,
-                release_id=release_id,
-                skill_key=skill_key,
-                require_stable=require_stable,
-            ),
-            error_action="syncing skill release",
-        )
+    return result
 
 
 async def _sync_release_to_dict(
     client: Any,
+    sandbox: Any,
     *,
-    release_id: str | None,
-    skill_key: str | None,
-    require_stable: bool,
+    release_id: str | None = None,
+    skill_key: str | None = None,
+    require_stable: bool = True,
 ) -> dict[str, str]:
-    sync_mgr = NeoSkillSyncManager()
+    _ = sandbox
+    sync_mgr = _sync_mgr()
     result = await sync_mgr.sync_release(
         client,
         release_id=release_id,
@@ -61,7 +61,7 @@ async def handle_result(result: dict, event: AstrMessageEvent) -> ToolExecResult
     return resp
 
 
-@dataclass
+@dataclass(slots=True)
 class PythonTool(FunctionTool):
     name: str = "astrbot_execute_ipython"
     description: str = f"Run codes in an IPython shell. Current OS: {_OS_NAME}."
@@ -83,7 +83,7 @@ class PythonTool(FunctionTool):
             return f"Error executing code: {str(e)}"
 
 
-@dataclass
+@dataclass(slots=True)
 class LocalPythonTool(FunctionTool):
     name: str = "astrbot_execute_python"
     description: str = (
@@ -10,7 +10,7 @@ from ..computer_client import get_booter, get_local_booter
 from .permissions import check_admin_permission
 
 
-@dataclass
+@dataclass(slots=True)
 class ExecuteShellTool(FunctionTool):
     name: str = "astrbot_execute_shell"
     description: str = "Execute a command in the shell."
@@ -1,21 +1,45 @@
 from __future__ import annotations
 
-import hashlib
+import asyncio
+import copy
+import functools
 import json
 import os
 import re
+import threading
+import time
+import zlib
 from dataclasses import dataclass
 from datetime import datetime, timezone
 from pathlib import Path
 from typing import Any
 
-from astrbot.core.computer.computer_client import sync_skills_to_active_sandboxes
-from astrbot.core.skills.skill_manager import SkillManager
+from pydantic import BaseModel, ConfigDict, Field, ValidationError
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
 from astrbot.core.utils.astrbot_path import get_astrbot_skills_path
 
 _MAP_VERSION = 1
 _MAP_FILE_NAME = "neo_skill_map.json"
+_RELEASE_CACHE_TTL_S = 60.0
+_RELEASE_CACHE_MAX = 256
 _SKILL_NAME_RE = re.compile(r"[^a-zA-Z0-9._-]+")
+_NAME_TRANS = str.maketrans(
+    {chr(c): "-" for c in range(128) if not re.match(r"[a-zA-Z0-9._-]", chr(c))}
+)
+_WS_RE = re.compile(r"\s+")
+_DESC_HEADING_RE = re.compile(
+    r"^[^\S\n]*## (?:描述|description)[^\S\n]*$", re.IGNORECASE | re.MULTILINE
+)
+_NONEMPTY_LINE_RE = re.compile(r"^[^\S\n]*(\S[^\n]*)", re.MULTILINE)
+_FIRST_TEXT_RE = re.compile(r"^[^\S\n]*([^#\s][^\n]*)", re.MULTILINE)
+# Same delimiter tolerance as skill_manager's frontmatter parser: trailing
+# whitespace (including CR from CRLF files) after "---" is accepted.
+_FRONTMATTER_RE = re.compile(r"^---[^\S\n]*\n(.*?)\n---[^\S\n]*(?:\n|$)", re.S)
 
 
 def _now_iso() -> str:
@@ -33,24 +57,14 @@ def _to_jsonable(model_like: Any) -> dict[str, Any]:
 
 
 def _parse_frontmatter(text: str) -> tuple[dict[str, str], str]:
-    if not text.startswith("---"):
-        return {}, text
-
-    lines = text.splitlines()
-    if not lines or lines[0].strip() != "---":
-        return {}, text
-
-    end_idx = None
-    for i in range(1, len(lines)):
-        if lines[i].strip() == "---":
-            end_idx = i
-            break
-
-    if end_idx is None:
+    # Only the (tiny) frontmatter slice is ever split into lines, not the
+    # whole body.
+    match = _FRONTMATTER_RE.match(text)
+    if not match:
         return {}, text
 
     data: dict[str, str] = {}
-    for line in lines[1:end_idx]:
+    for line in match.group(1).splitlines():
         if ":" not in line:
             continue
         key, value = line.split(":", 1)
@@ -59,52 +73,59 @@ def _parse_frontmatter(text: str) -> tuple[dict[str, str], str]:
         if key in {"name", "description"} and value:
             data[key] = value
 
-    body = "\n".join(lines[end_idx + 1 :]).lstrip("\n")
+    body = text[match.end() :].lstrip("\r\n")
     return data, body
 
 
 def _derive_description(markdown_body: str) -> str:
-    lines = markdown_body.splitlines()
-
-    heading_idx = None
-    for i, line in enumerate(lines):
-        normalized = line.strip().lower()
-        if normalized in {"## 描述", "## description"}:
-            heading_idx = i
-            break
-
-    if heading_idx is not None:
-        for line in lines[heading_idx + 1 :]:
-            text = line.strip()
-            if not text:
-                continue
-            if text.startswith("#"):
-                break
-            return text
-
-    for line in lines:
-        text = line.strip()
-        if not text or text.startswith("#"):
-            continue
-        return text
+    heading = _DESC_HEADING_RE.search(markdown_body)
+    if heading:
+        first = _NONEMPTY_LINE_RE.search(markdown_body, heading.end())
+        if first and not first.group(1).startswith("#"):
+            return first.group(1).rstrip()
 
-    return ""
+    first = _FIRST_TEXT_RE.search(markdown_body)
+    return first.group(1).rstrip() if first else ""
 
 
 def _ensure_skill_frontmatter(markdown: str, *, skill_name: str, skill_key: str) -> str:
     frontmatter, body = _parse_frontmatter(markdown)
 
     name = frontmatter.get("name") or skill_name
-    name = " ".join(str(name).split())
+    name = _WS_RE.sub(" ", str(name)).strip()
     description = frontmatter.get("description") or _derive_description(body)
     if not description:
         description = f"Synced skill for `{skill_key}`."
 
-    description = " ".join(description.split())
+    description = _WS_RE.sub(" ", description).strip()
 
-    header = f"---\nname: {name}\ndescription: {description}\n---\n\n"
     body = body.strip("\n")
-    return f"{header}{body}\n"
+    header = ("---\nname: ", name, "\ndescription: ", description, "\n---\n\n")
+
+    # Payloads produced by this pipeline usually arrive already in canonical
+    # form; when the input is exactly header + body + newline, hand it back
+    # without re-assembling a fresh copy of the (potentially large) body.
+    header_len = sum(map(len, header))
+    if (
+        len(markdown) == header_len + len(body) + 1
+        and markdown.endswith("\n")
+        and markdown.startswith("".join(header))
+    ):
+        return markdown
+
+    # Assemble in one join; header + body concatenation would allocate an
+    # extra copy of the body.
+    return "".join(header + (body, "\n"))
+
+
+class _ReleaseView(BaseModel):
+    """The release fields sync_release depends on, checked in one pass."""
+
+    model_config = ConfigDict(extra="ignore", coerce_numbers_to_str=True)
+
+    id: str = Field(min_length=1)
+    skill_key: str = Field(min_length=1)
+    candidate_id: str = Field(min_length=1)
 
 
 @dataclass
@@ -119,17 +140,41 @@ class NeoSkillSyncResult:
 
 
 class NeoSkillSyncManager:
+    # Debounce window for coalescing sandbox syncs across a burst of
+    # releases; shared process-wide since sandboxes are process-wide too.
+    _SANDBOX_SYNC_DEBOUNCE_S = 0.25
+    _pending_sandbox_sync: asyncio.Task | None = None
+
+    @classmethod
+    def _schedule_sandbox_sync(cls) -> asyncio.Task:
+        """Schedule one debounced sandbox sync for a burst of release syncs.
+
+        Each call cancels the previously pending sync, so a loop syncing N
+        releases ships the skills tree to the sandboxes once instead of N
+        times.
+        """
+        pending = cls._pending_sandbox_sync
+        if pending is not None and not pending.done():
+            pending.cancel()
+
+        async def _debounced() -> None:
+            from astrbot.core.computer.computer_client import (
+                sync_skills_to_active_sandboxes,
+            )
+
+            await asyncio.sleep(cls._SANDBOX_SYNC_DEBOUNCE_S)
+            await sync_skills_to_active_sandboxes()
+
+        task = asyncio.create_task(_debounced())
+        cls._pending_sandbox_sync = task
+        return task
+
     @staticmethod
     def sync_result_to_dict(result: NeoSkillSyncResult) -> dict[str, str]:
-        return {
-            "skill_key": result.skill_key,
-            "local_skill_name": result.local_skill_name,
-            "release_id": result.release_id,
-            "candidate_id": result.candidate_id,
-            "payload_ref": result.payload_ref,
-            "map_path": result.map_path,
-            "synced_at": result.synced_at,
-        }
+        # All fields are flat strings, so the instance dict already is the
+        # wire form; copying it beats rebuilding the mapping field by field
+        # (and unlike dataclasses.asdict, skips the recursive deep copy).
+        return dict(vars(result))
 
     def __init__(
         self,
@@ -140,30 +185,81 @@ class NeoSkillSyncManager:
         self.skills_root = skills_root or get_astrbot_skills_path()
         self.map_path = map_path or str(Path(self.skills_root) / _MAP_FILE_NAME)
         os.makedirs(self.skills_root, exist_ok=True)
+        # Parsed map keyed by (st_mtime_ns, st_size) so repeated syncs skip
+        # re-reading an unchanged file. Callers mutate the returned mapping,
+        # hence the deep copy on cache hits.
+        self._map_cache: tuple[int, int, dict[str, Any]] | None = None
+        self._map_lock = threading.Lock()
+        # Local skill names already taken in the map, rebuilt lazily after
+        # each fresh parse instead of on every name resolution.
+        self._used_names: set[str] | None = None
+        # Recently looked-up releases keyed by id: (monotonic timestamp, payload).
+        self._release_cache: dict[str, tuple[float, dict[str, Any]]] = {}
 
     def _load_map(self) -> dict[str, Any]:
-        if not os.path.exists(self.map_path):
+        # A single stat doubles as the existence check; probing with
+        # os.path.exists first would cost an extra syscall and race with
+        # concurrent creation or deletion.
+        try:
+            stat = os.stat(self.map_path)
+        except OSError:
             return {"version": _MAP_VERSION, "items": {}}
+        with self._map_lock:
+            cached = self._map_cache
+            if cached and cached[0] == stat.st_mtime_ns and cached[1] == stat.st_size:
+                return copy.deepcopy(cached[2])
         try:
-            with open(self.map_path, encoding="utf-8") as f:
-                data = json.load(f)
+            raw = Path(self.map_path).read_bytes()
+            data = orjson.loads(raw) if orjson else json.loads(raw)
             if not isinstance(data, dict):
                 return {"version": _MAP_VERSION, "items": {}}
             items = data.get("items", {})
             if not isinstance(items, dict):
                 items = {}
-            return {"version": int(data.get("version", _MAP_VERSION)), "items": items}
+            parsed = {
+                "version": int(data.get("version", _MAP_VERSION)),
+                "items": items,
+            }
         except Exception:
             return {"version": _MAP_VERSION, "items": {}}
+        with self._map_lock:
+            self._map_cache = (stat.st_mtime_ns, stat.st_size, copy.deepcopy(parsed))
+            self._used_names = None
+        return parsed
 
     def _save_map(self, data: dict[str, Any]) -> None:
         os.makedirs(os.path.dirname(self.map_path), exist_ok=True)
-        with open(self.map_path, "w", encoding="utf-8") as f:
-            json.dump(data, f, ensure_ascii=False, indent=2)
+        if orjson:
+            payload = orjson.dumps(data, option=orjson.OPT_INDENT_2)
+        else:
+            payload = json.dumps(data, ensure_ascii=False, indent=2).encode("utf-8")
+        # Write to a sibling temp file and rename so a crash mid-write never
+        # leaves a truncated map behind.
+        tmp_path = self.map_path + ".tmp"
+        fd = os.open(tmp_path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o644)
+        try:
+            os.write(fd, payload)
+            os.fsync(fd)
+        finally:
+            os.close(fd)
+        os.replace(tmp_path, self.map_path)
+        try:
+            stat = os.stat(self.map_path)
+        except OSError:
+            return
+        with self._map_lock:
+            self._map_cache = (stat.st_mtime_ns, stat.st_size, copy.deepcopy(data))
 
     @staticmethod
+    @functools.lru_cache(maxsize=4096)
     def normalize_skill_name(skill_key: str) -> str:
-        normalized = _SKILL_NAME_RE.sub("-", skill_key.strip().lower())
+        key = skill_key.strip().lower()
+        if key.isascii() and key.translate(_NAME_TRANS) == key:
+            # Already clean: every char is in [a-zA-Z0-9._-], so the regex
+            # substitution would be a no-op — skip the regex VM entirely.
+            normalized = key
+        else:
+            normalized = _SKILL_NAME_RE.sub("-", key)
         normalized = normalized.strip("._-")
         if not normalized:
             normalized = "skill"
@@ -180,31 +276,97 @@ class NeoSkillSyncManager:
                 return local_name
 
         base = self.normalize_skill_name(skill_key)
-        used_names = {
-            str(v.get("local_skill_name"))
-            for v in items.values()
-            if isinstance(v, dict) and v.get("local_skill_name")
-        }
-        if base not in used_names:
+        if self._used_names is None:
+            self._used_names = {
+                str(v.get("local_skill_name"))
+                for v in items.values()
+                if isinstance(v, dict) and v.get("local_skill_name")
+            }
+        if base not in self._used_names:
             return base
-        suffix = hashlib.sha1(skill_key.encode("utf-8")).hexdigest()[:8]
+        # Disambiguation only needs a stable suffix, not a cryptographic
+        # digest, so crc32 is plenty (and much cheaper than sha1).
+        suffix = f"{zlib.crc32(skill_key.encode('utf-8')):08x}"
         return f"{base}-{suffix}"
 
     async def _find_release(self, client: Any, *, release_id: str) -> dict[str, Any]:
-        offset = 0
-        while True:
-            page = await client.skills.list_releases(limit=100, offset=offset)
-            page_json = _to_jsonable(page)
-            items = page_json.get("items", [])
-            if not isinstance(items, list):
-                items = []
+        cached = self._release_cache.get(release_id)
+        if cached and time.monotonic() - cached[0] < _RELEASE_CACHE_TTL_S:
+            return cached[1]
+        release = await self._lookup_release(client, release_id=release_id)
+        self._release_cache[release_id] = (time.monotonic(), release)
+        while len(self._release_cache) > _RELEASE_CACHE_MAX:
+            # Insertion order means the first key is the oldest lookup.
+            self._release_cache.pop(next(iter(self._release_cache)))
+        return release
+
+    def invalidate_release_cache(
+        self,
+        *,
+        release_id: str | None = None,
+        skill_key: str | None = None,
+    ) -> None:
+        """Drop cached release lookups after a stage change.
+
+        Promotions and rollbacks change which release is active; without
+        this, a sync within the TTL could act on a release that still
+        reports its old stage.
+        """
+        if release_id is None and skill_key is None:
+            self._release_cache.clear()
+            return
+        if release_id is not None:
+            self._release_cache.pop(release_id, None)
+        if skill_key is not None:
+            self._release_cache = {
+                rid: entry
+                for rid, entry in self._release_cache.items()
+                if entry[1].get("skill_key") != skill_key
+            }
+
+    async def _lookup_release(self, client: Any, *, release_id: str) -> dict[str, Any]:
+        # Prefer a server-side filter when the SDK accepts one; fall back to
+        # the paginated scan for SDKs without the parameter (or servers that
+        # ignore it, in which case the returned item will not match).
+        try:
+            page_json = _to_jsonable(
+                await client.skills.list_releases(
+                    release_id=release_id, limit=1, offset=0
+                )
+            )
+        except TypeError:
+            page_json = {}
+        items = page_json.get("items", [])
+        if isinstance(items, list):
             for item in items:
                 if isinstance(item, dict) and item.get("id") == release_id:
                     return item
-            total = int(page_json.get("total", 0) or 0)
-            offset += len(items)
-            if offset >= total or not items:
-                break
+
+        page_json = _to_jsonable(await client.skills.list_releases(limit=100, offset=0))
+        items = page_json.get("items", [])
+        if not isinstance(items, list):
+            items = []
+        for item in items:
+            if isinstance(item, dict) and item.get("id") == release_id:
+                return item
+
+        # The first page tells us the total, so the remaining pages can be
+        # fetched concurrently instead of one blocking round-trip at a time.
+        total = int(page_json.get("total", 0) or 0)
+        if items and total > len(items):
+            pages = await asyncio.gather(
+                *(
+                    client.skills.list_releases(limit=100, offset=offset)
+                    for offset in range(len(items), total, 100)
+                )
+            )
+            for page in pages:
+                page_items = _to_jsonable(page).get("items", [])
+                if not isinstance(page_items, list):
+                    continue
+                for item in page_items:
+                    if isinstance(item, dict) and item.get("id") == release_id:
+                        return item
         raise ValueError(f"Release not found: {release_id}")
 
     async def _find_active_stable_release(
@@ -237,32 +399,50 @@ class NeoSkillSyncManager:
         release_id: str | None = None,
         skill_key: str | None = None,
         require_stable: bool = True,
+        release: dict[str, Any] | None = None,
+        defer_sandbox_sync: bool = False,
     ) -> NeoSkillSyncResult:
-        if release_id:
-            release = await self._find_release(client, release_id=release_id)
-        elif skill_key:
-            release = await self._find_active_stable_release(
-                client, skill_key=skill_key
-            )
-        else:
-            raise ValueError("release_id or skill_key is required for sync.")
+        """Sync one release to local SKILL.md.
+
+        ``release`` may carry an already-fetched release payload (e.g. the
+        response of ``promote_candidate``) to skip the lookup round-trip.
+
+        ``defer_sandbox_sync`` batches the sandbox refresh behind a short
+        debounce window; callers syncing many releases in a loop should set
+        it so the skills tree is shipped once instead of per release.
+        """
+        if release is None:
+            if release_id:
+                release = await self._find_release(client, release_id=release_id)
+            elif skill_key:
+                release = await self._find_active_stable_release(
+                    client, skill_key=skill_key
+                )
+            else:
+                raise ValueError("release_id or skill_key is required for sync.")
 
-        release_id_val = str(release.get("id") or "")
+        try:
+            view = _ReleaseView.model_validate(release)
+        except ValidationError as err:
+            raise ValueError("Release payload is incomplete.") from err
+        release_id_val = view.id
+        skill_key_val = view.skill_key
+        candidate_id = view.candidate_id
         release_stage_raw = release.get("stage")
         release_stage_value = getattr(release_stage_raw, "value", release_stage_raw)
         release_stage = str(release_stage_value or "").strip().lower()
-        skill_key_val = str(release.get("skill_key") or "")
-        candidate_id = str(release.get("candidate_id") or "")
-
-        if not release_id_val or not skill_key_val or not candidate_id:
-            raise ValueError("Release payload is incomplete.")
         if require_stable and release_stage != "stable":
             raise ValueError(
                 "Only stable releases can be synced to local SKILL.md "
                 f"(got: {release_stage_raw})."
             )
 
-        candidate = await client.skills.get_candidate(candidate_id)
+        # The map read only touches local disk; overlap it with the candidate
+        # round-trip instead of paying for both sequentially.
+        candidate, mapping = await asyncio.gather(
+            client.skills.get_candidate(candidate_id),
+            asyncio.to_thread(self._load_map),
+        )
         candidate_json = _to_jsonable(candidate)
         payload_ref = candidate_json.get("payload_ref")
         if not isinstance(payload_ref, str) or not payload_ref:
@@ -280,7 +460,6 @@ class NeoSkillSyncManager:
                 "payload.skill_markdown is required for stable sync to local skill."
             )
 
-        mapping = self._load_map()
         local_skill_name = self._resolve_local_skill_name(skill_key_val, mapping)
         skill_dir = Path(self.skills_root) / local_skill_name
         skill_dir.mkdir(parents=True, exist_ok=True)
@@ -292,24 +471,54 @@ class NeoSkillSyncManager:
         )
 
         skill_md_path = skill_dir / "SKILL.md"
-        skill_md_path.write_text(normalized_markdown, encoding="utf-8")
+        markdown_bytes = normalized_markdown.encode("utf-8")
+        try:
+            existing = await asyncio.to_thread(skill_md_path.read_bytes)
+            markdown_unchanged = existing == markdown_bytes
+        except OSError:
+            markdown_unchanged = False
+        if not markdown_unchanged:
+            await asyncio.to_thread(skill_md_path.write_bytes, markdown_bytes)
 
         items = mapping.setdefault("items", {})
-        items[skill_key_val] = {
+        prior_entry = items.get(skill_key_val)
+        entry = {
             "local_skill_name": local_skill_name,
             "latest_release_id": release_id_val,
             "latest_candidate_id": candidate_id,
             "latest_payload_ref": payload_ref,
             "updated_at": _now_iso(),
         }
-        mapping["version"] = _MAP_VERSION
-        self._save_map(mapping)
+        # An idempotent re-sync of the same release produces the same entry;
+        # only updated_at would move, which is not worth a map rewrite.
+        map_unchanged = (
+            isinstance(prior_entry, dict)
+            and mapping.get("version") == _MAP_VERSION
+            and {k: v for k, v in prior_entry.items() if k != "updated_at"}
+            == {k: v for k, v in entry.items() if k != "updated_at"}
+        )
+        if not map_unchanged:
+            items[skill_key_val] = entry
+            mapping["version"] = _MAP_VERSION
+            if self._used_names is not None:
+                self._used_names.add(local_skill_name)
+            await asyncio.to_thread(self._save_map, mapping)
+
+        # Imported lazily: both pull in large dependency graphs that callers
+        # who only parse frontmatter or resolve names never need.
+        from astrbot.core.computer.computer_client import (
+            sync_skills_to_active_sandboxes,
+        )
+        from astrbot.core.skills.skill_manager import SkillManager
 
         # Ensure local skill is visible to AstrBot skill manager.
         SkillManager().set_skill_active(local_skill_name, True)
 
         # Best-effort synchronization to active sandboxes.
-        await sync_skills_to_active_sandboxes()
+        if defer_sandbox_sync:
+            self._schedule_sandbox_sync()
+        else:
+            await sync_skills_to_active_sandboxes()
 
         return NeoSkillSyncResult(
             skill_key=skill_key_val,
@@ -332,6 +541,8 @@ class NeoSkillSyncManager:
         release = await client.skills.promote_candidate(candidate_id, stage=stage)
         release_json = _to_jsonable(release)
 
+        self.invalidate_release_cache(skill_key=release_json.get("skill_key"))
+
         sync_json: dict[str, Any] | None = None
         rollback_json: dict[str, Any] | None = None
         sync_error: str | None = None
@@ -342,6 +553,7 @@ class NeoSkillSyncManager:
                     client,
                     release_id=str(release_json.get("id", "")),
                     require_stable=True,
+                    release=release_json,
                 )
                 sync_json = self.sync_result_to_dict(sync_result)
             except Exception as err:
@@ -1,19 +1,27 @@
 from __future__ import annotations
 
+import copy
+import functools
+import hashlib
 import json
 import os
 import re
 import shutil
 import tempfile
+import time
 import zipfile
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass
-from datetime import datetime, timezone
 from pathlib import Path, PurePosixPath
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
 from astrbot.core.utils.astrbot_path import (
     get_astrbot_data_path,
     get_astrbot_skills_path,
-    get_astrbot_temp_path,
 )
 
 SKILLS_CONFIG_FILENAME = "skills.json"
@@ -24,9 +32,11 @@ SANDBOX_WORKSPACE_ROOT = "/workspace"
 _SANDBOX_SKILLS_CACHE_VERSION = 1
 
 _SKILL_NAME_RE = re.compile(r"^[A-Za-z0-9._-]+$")
+_FRONTMATTER_RE = re.compile(r"^---[^\S\n]*\n(.*?)\n---[^\S\n]*(?:\n|$)", re.S)
+_DESCRIPTION_RE = re.compile(r"^[^\S\n]*description[^\S\n]*:(.*)$", re.I | re.M)
 
 
-@dataclass
+@dataclass(slots=True)
 class SkillInfo:
     name: str
     description: str
@@ -37,6 +47,9 @@ class SkillInfo:
     local_exists: bool = True
     sandbox_exists: bool = False
 
+    def to_dict(self) -> dict:
+        return {name: getattr(self, name) for name in self.__slots__}
+
 
 def _parse_frontmatter_description(text: str) -> str:
     """Extract the ``description`` value from YAML frontmatter.
@@ -49,30 +62,104 @@ def _parse_frontmatter_description(text: str) -> str:
         description: What this skill does and when to use it.
         ---
     """
-    if not text.startswith("---"):
+    frontmatter = _FRONTMATTER_RE.match(text)
+    if not frontmatter:
         return ""
-    lines = text.splitlines()
-    if not lines or lines[0].strip() != "---":
+    value = _DESCRIPTION_RE.search(frontmatter.group(1))
+    if not value:
         return ""
-    end_idx = None
-    for i in range(1, len(lines)):
-        if lines[i].strip() == "---":
-            end_idx = i
-            break
-    if end_idx is None:
+    return value.group(1).strip().strip('"').strip("'")
+
+
+# Frontmatter sits at the top of SKILL.md; reading more than this just to
+# extract the description wastes I/O on skills with long instruction bodies.
+_FRONTMATTER_HEAD_BYTES = 4096
+
+
+def _read_frontmatter_head(path: Path) -> str:
+    """Read at most the first few KiB of a skill file for frontmatter parsing."""
+    with open(path, "rb") as f:
+        head = f.read(_FRONTMATTER_HEAD_BYTES)
+    if not head.startswith(b"---"):
         return ""
-    for line in lines[1:end_idx]:
-        if ":" not in line:
-            continue
-        key, value = line.split(":", 1)
-        if key.strip().lower() == "description":
-            return value.strip().strip('"').strip("'")
-    return ""
+    return head.decode("utf-8", errors="replace")
 
 
 # Regex for sanitizing paths used in prompt examples — only allow
 # safe path characters to prevent prompt injection via crafted skill paths.
 _SAFE_PATH_RE = re.compile(r"[^A-Za-z0-9_./ -]")
+# Deletion table for the ASCII range; paths containing non-ASCII fall back to
+# the regex so every disallowed character is still stripped.
+_SAFE_PATH_TRANS = str.maketrans(
+    {c: None for c in map(chr, range(128)) if _SAFE_PATH_RE.match(c)}
+)
+
+
+def _sanitize_example_path(path: str) -> str:
+    if path.isascii():
+        return path.translate(_SAFE_PATH_TRANS)
+    return _SAFE_PATH_RE.sub("", path)
+
+
+# Static prompt sections hoisted to module scope so build_skills_prompt only
+# assembles the per-skill lines; the footer carries the example-path slot.
+_PROMPT_HEADER = (
+    "## Skills\n\n"
+    "You have specialized skills — reusable instruction bundles stored "
+    "in `SKILL.md` files. Each skill has a **name** and a **description** "
+    "that tells you what it does and when to use it.\n\n"
+    "### Available skills\n\n"
+)
+_PROMPT_FOOTER = (
+    "\n\n### Skill rules\n\n"
+    "1. **Discovery** — The list above is the complete skill inventory "
+    "for this session. Full instructions are in the referenced "
+    "`SKILL.md` file.\n"
+    "2. **When to trigger** — Use a skill if the user names it "
+    "explicitly, or if the task clearly matches the skill's description. "
+    "*Never silently skip a matching skill* — either use it or briefly "
+    "explain why you chose not to.\n"
+    "3. **Mandatory grounding** — Before executing any skill you MUST "
+    "first read its `SKILL.md` by running a shell command with the "
+    "**absolute path** shown above (e.g. `cat {example_path}`). "
+    "Never rely on memory or assumptions about a skill's content.\n"
+    "4. **Progressive disclosure** — Load only what is directly "
+    "referenced from `SKILL.md`:\n"
+    "   - If `scripts/` exist, prefer running or patching them over "
+    "rewriting code from scratch.\n"
+    "   - If `assets/` or templates exist, reuse them.\n"
+    "   - Do NOT bulk-load every file in the skill directory.\n"
+    "5. **Coordination** — When multiple skills apply, pick the minimal "
+    "set needed. Announce which skill(s) you are using and why "
+    "(one short line). Prefer `astrbot_*` tools when running skill "
+    "scripts.\n"
+    "6. **Context hygiene** — Avoid deep reference chasing; open only "
+    "files that are directly linked from `SKILL.md`.\n"
+    "7. **Failure handling** — If a skill cannot be applied, state the "
+    "issue clearly and continue with the best alternative.\n"
+)
+
+
+@functools.lru_cache(maxsize=8)
+def _build_skills_prompt_cached(key: tuple[tuple[str, str, str], ...]) -> str:
+    skills_lines: list[str] = []
+    example_path = ""
+    for name, description, path in key:
+        description = description or "No description"
+        skills_lines.append(f"- **{name}**: {description}\n  File: `{path}`")
+        if not example_path:
+            example_path = path
+    # Sanitize example_path — it may originate from sandbox cache (untrusted)
+    example_path = _sanitize_example_path(example_path) if example_path else ""
+    example_path = example_path or "<skills_root>/<skill_name>/SKILL.md"
+
+    return "".join(
+        (
+            _PROMPT_HEADER,
+            "\n".join(skills_lines),
+            _PROMPT_FOOTER.format(example_path=example_path),
+        )
+    )
 
 
 def build_skills_prompt(skills: list[SkillInfo]) -> str:
@@ -81,54 +168,26 @@ def build_skills_prompt(skills: list[SkillInfo]) -> str:
     Generates a markdown-formatted skill inventory for the LLM.  Only
     ``name`` and ``description`` are shown upfront; the LLM must read
     the full ``SKILL.md`` before execution (progressive disclosure).
+
+    The rendered text is deterministic in the skill list, so results are
+    memoized on a (name, description, path) key — an unchanged inventory
+    costs one tuple build per LLM call instead of a full render.
     """
-    skills_lines: list[str] = []
-    example_path = ""
-    for skill in skills:
-        description = skill.description or "No description"
-        skills_lines.append(
-            f"- **{skill.name}**: {description}\n  File: `{skill.path}`"
-        )
-        if not example_path:
-            example_path = skill.path
-    skills_block = "\n".join(skills_lines)
-    # Sanitize example_path — it may originate from sandbox cache (untrusted)
-    example_path = _SAFE_PATH_RE.sub("", example_path) if example_path else ""
-    example_path = example_path or "<skills_root>/<skill_name>/SKILL.md"
+    return _build_skills_prompt_cached(
+        tuple((skill.name, skill.description, skill.path) for skill in skills)
+    )
+
 
+def _utc_isoformat_now() -> str:
+    """Format the current UTC time like ``datetime.now(timezone.utc).isoformat()``.
+
+    Built from ``time.time_ns`` + ``time.strftime`` so the hot cache-write
+    path skips constructing datetime and timezone objects on every save.
+    """
+    secs, ns = divmod(time.time_ns(), 1_000_000_000)
     return (
-        "## Skills\n\n"
-        "You have specialized skills — reusable instruction bundles stored "
-        "in `SKILL.md` files. Each skill has a **name** and a **description** "
-        "that tells you what it does and when to use it.\n\n"
-        "### Available skills\n\n"
-        f"{skills_block}\n\n"
-        "### Skill rules\n\n"
-        "1. **Discovery** — The list above is the complete skill inventory "
-        "for this session. Full instructions are in the referenced "
-        "`SKILL.md` file.\n"
-        "2. **When to trigger** — Use a skill if the user names it "
-        "explicitly, or if the task clearly matches the skill's description. "
-        "*Never silently skip a matching skill* — either use it or briefly "
-        "explain why you chose not to.\n"
-        "3. **Mandatory grounding** — Before executing any skill you MUST "
-        "first read its `SKILL.md` by running a shell command with the "
-        f"**absolute path** shown above (e.g. `cat {example_path}`). "
-        "Never rely on memory or assumptions about a skill's content.\n"
-        "4. **Progressive disclosure** — Load only what is directly "
-        "referenced from `SKILL.md`:\n"
-        "   - If `scripts/` exist, prefer running or patching them over "
-        "rewriting code from scratch.\n"
-        "   - If `assets/` or templates exist, reuse them.\n"
-        "   - Do NOT bulk-load every file in the skill directory.\n"
-        "5. **Coordination** — When multiple skills apply, pick the minimal "
-        "set needed. Announce which skill(s) you are using and why "
-        "(one short line). Prefer `astrbot_*` tools when running skill "
-        "scripts.\n"
-        "6. **Context hygiene** — Avoid deep reference chasing; open only "
-        "files that are directly linked from `SKILL.md`.\n"
-        "7. **Failure handling** — If a skill cannot be applied, state the "
-        "issue clearly and continue with the best alternative.\n"
+        time.strftime("%Y-%m-%dT%H:%M:%S", time.gmtime(secs))
+        + f".{ns // 1000:06d}+00:00"
     )
 
 
@@ -136,48 +195,107 @@ class SkillManager:
     def __init__(self, skills_root: str | None = None) -> None:
         self.skills_root = skills_root or get_astrbot_skills_path()
         data_path = Path(get_astrbot_data_path())
-        self.config_path = str(data_path / SKILLS_CONFIG_FILENAME)
-        self.sandbox_skills_cache_path = str(data_path / SANDBOX_SKILLS_CACHE_FILENAME)
+        self.config_path: Path = data_path / SKILLS_CONFIG_FILENAME
+        self.sandbox_skills_cache_path: Path = data_path / SANDBOX_SKILLS_CACHE_FILENAME
         os.makedirs(self.skills_root, exist_ok=True)
+        # Parsed JSON keyed by (st_mtime_ns, st_size) so repeated loads of an
+        # unchanged file reuse the previous parse. Hits return deep copies
+        # because callers mutate the returned dicts.
+        self._config_cache: tuple[int, int, dict] | None = None
+        self._sandbox_cache: tuple[int, int, dict] | None = None
+        # SKILL.md descriptions keyed by path -> (st_mtime_ns, description).
+        self._desc_cache: dict[str, tuple[int, str]] = {}
+        # Validated zip archives keyed by (head digest, size) -> skill name,
+        # so re-installing the same archive skips the name-list walk.
+        self._zip_validation_cache: dict[tuple[str, int], str] = {}
+
+    @staticmethod
+    def _write_json_atomic(path: Path, document: dict) -> None:
+        """Serialize once and publish via rename so readers never see a torn file."""
+        if orjson:
+            payload = orjson.dumps(document, option=orjson.OPT_INDENT_2)
+        else:
+            payload = json.dumps(document, ensure_ascii=False, indent=2).encode("utf-8")
+        fd, tmp_path = tempfile.mkstemp(dir=path.parent, suffix=".tmp")
+        try:
+            os.write(fd, payload)
+            os.fsync(fd)
+        except BaseException:
+            os.close(fd)
+            os.unlink(tmp_path)
+            raise
+        os.close(fd)
+        os.replace(tmp_path, path)
+
+    @staticmethod
+    def _cache_lookup(
+        cache: tuple[int, int, dict] | None, stat: os.stat_result
+    ) -> dict | None:
+        if cache and cache[0] == stat.st_mtime_ns and cache[1] == stat.st_size:
+            return copy.deepcopy(cache[2])
+        return None
 
     def _load_config(self) -> dict:
-        if not os.path.exists(self.config_path):
+        try:
+            stat = self.config_path.stat()
+        except OSError:
             self._save_config(DEFAULT_SKILLS_CONFIG.copy())
             return DEFAULT_SKILLS_CONFIG.copy()
-        with open(self.config_path, encoding="utf-8") as f:
-            data = json.load(f)
+        cached = self._cache_lookup(self._config_cache, stat)
+        if cached is not None:
+            return cached
+        raw = self.config_path.read_bytes()
+        data = orjson.loads(raw) if orjson else json.loads(raw)
         if not isinstance(data, dict) or "skills" not in data:
             return DEFAULT_SKILLS_CONFIG.copy()
+        self._config_cache = (stat.st_mtime_ns, stat.st_size, copy.deepcopy(data))
         return data
 
     def _save_config(self, config: dict) -> None:
-        with open(self.config_path, "w", encoding="utf-8") as f:
-            json.dump(config, f, ensure_ascii=False, indent=4)
+        self._write_json_atomic(self.config_path, config)
+        try:
+            stat = self.config_path.stat()
+        except OSError:
+            self._config_cache = None
+            return
+        self._config_cache = (stat.st_mtime_ns, stat.st_size, copy.deepcopy(config))
 
     def _load_sandbox_skills_cache(self) -> dict:
-        if not os.path.exists(self.sandbox_skills_cache_path):
+        try:
+            stat = self.sandbox_skills_cache_path.stat()
+        except OSError:
             return {"version": _SANDBOX_SKILLS_CACHE_VERSION, "skills": []}
+        cached = self._cache_lookup(self._sandbox_cache, stat)
+        if cached is not None:
+            return cached
         try:
-            with open(self.sandbox_skills_cache_path, encoding="utf-8") as f:
-                data = json.load(f)
+            raw = self.sandbox_skills_cache_path.read_bytes()
+            data = orjson.loads(raw) if orjson else json.loads(raw)
             if not isinstance(data, dict):
                 return {"version": _SANDBOX_SKILLS_CACHE_VERSION, "skills": []}
             skills = data.get("skills", [])
             if not isinstance(skills, list):
                 skills = []
-            return {
+            parsed = {
                 "version": int(data.get("version", _SANDBOX_SKILLS_CACHE_VERSION)),
                 "skills": skills,
                 "updated_at": data.get("updated_at"),
             }
         except Exception:
             return {"version": _SANDBOX_SKILLS_CACHE_VERSION, "skills": []}
+        self._sandbox_cache = (stat.st_mtime_ns, stat.st_size, copy.deepcopy(parsed))
+        return parsed
 
     def _save_sandbox_skills_cache(self, cache: dict) -> None:
         cache["version"] = _SANDBOX_SKILLS_CACHE_VERSION
-        cache["updated_at"] = datetime.now(timezone.utc).isoformat()
-        with open(self.sandbox_skills_cache_path, "w", encoding="utf-8") as f:
-            json.dump(cache, f, ensure_ascii=False, indent=2)
+        cache["updated_at"] = _utc_isoformat_now()
+        self._write_json_atomic(self.sandbox_skills_cache_path, cache)
+        try:
+            stat = self.sandbox_skills_cache_path.stat()
+        except OSError:
+            self._sandbox_cache = None
+            return
+        self._sandbox_cache = (stat.st_mtime_ns, stat.st_size, copy.deepcopy(cache))
 
     def set_sandbox_skills_cache(self, skills: list[dict]) -> None:
         """Persist sandbox skill metadata discovered from runtime side."""
@@ -208,7 +326,7 @@ class SkillManager:
         skills = cache.get("skills", [])
         count = len(skills) if isinstance(skills, list) else 0
         return {
-            "exists": os.path.exists(self.sandbox_skills_cache_path),
+            "exists": self.sandbox_skills_cache_path.exists(),
             "ready": count > 0,
             "count": count,
             "updated_at": cache.get("updated_at"),
@@ -232,10 +350,12 @@ class SkillManager:
         modified = False
         skills_by_name: dict[str, SkillInfo] = {}
 
+        # One pass over the sandbox cache validates every entry; both the
+        # local loop and the sandbox-only merge below work off these dicts.
         sandbox_cached_paths: dict[str, str] = {}
         sandbox_cached_descriptions: dict[str, str] = {}
-        cache_for_paths = self._load_sandbox_skills_cache()
-        for item in cache_for_paths.get("skills", []):
+        sandbox_cache = self._load_sandbox_skills_cache()
+        for item in sandbox_cache.get("skills", []):
             if not isinstance(item, dict):
                 continue
             name = str(item.get("name", "") or "").strip()
@@ -246,25 +366,24 @@ class SkillManager:
             if path:
                 sandbox_cached_paths[name] = path
 
-        for entry in sorted(Path(self.skills_root).iterdir()):
-            if not entry.is_dir():
-                continue
-            skill_name = entry.name
-            skill_md = entry / "SKILL.md"
-            if not skill_md.exists():
-                continue
+        # scandir exposes is_dir() from the directory read itself, avoiding
+        # the extra stat per entry that Path.iterdir + is_dir would issue.
+        with os.scandir(self.skills_root) as it:
+            dir_entries = sorted((e for e in it if e.is_dir()), key=lambda e: e.name)
+        local_entries = [
+            (entry.name, Path(entry.path) / "SKILL.md")
+            for entry in dir_entries
+            if os.path.isfile(os.path.join(entry.path, "SKILL.md"))
+        ]
+        descriptions = self._read_descriptions(local_entries)
+        for skill_name, skill_md in local_entries:
             active = skill_configs.get(skill_name, {}).get("active", True)
             if skill_name not in skill_configs:
                 skill_configs[skill_name] = {"active": active}
                 modified = True
             if active_only and not active:
                 continue
-            description = ""
-            try:
-                content = skill_md.read_text(encoding="utf-8")
-                description = _parse_frontmatter_description(content)
-            except Exception:
-                description = ""
+            description = descriptions[skill_name]
             sandbox_exists = (
                 runtime == "sandbox" and skill_name in sandbox_cached_descriptions
             )
@@ -289,16 +408,8 @@ class SkillManager:
             )
 
         if runtime == "sandbox":
-            cache = self._load_sandbox_skills_cache()
-            for item in cache.get("skills", []):
-                if not isinstance(item, dict):
-                    continue
-                skill_name = str(item.get("name", "")).strip()
-                if (
-                    not skill_name
-                    or skill_name in skills_by_name
-                    or not _SKILL_NAME_RE.match(skill_name)
-                ):
+            for skill_name, description in sandbox_cached_descriptions.items():
+                if skill_name in skills_by_name:
                     continue
                 active = skill_configs.get(skill_name, {}).get("active", True)
                 if skill_name not in skill_configs:
@@ -306,7 +417,6 @@ class SkillManager:
                     modified = True
                 if active_only and not active:
                     continue
-                description = sandbox_cached_descriptions.get(skill_name, "")
                 if show_sandbox_path:
                     path_str = f"{SANDBOX_WORKSPACE_ROOT}/{SANDBOX_SKILLS_ROOT}/{skill_name}/SKILL.md"
                 else:
@@ -330,6 +440,42 @@ class SkillManager:
 
         return [skills_by_name[name] for name in sorted(skills_by_name)]
 
+    def _read_descriptions(self, entries: list[tuple[str, Path]]) -> dict[str, str]:
+        """Read SKILL.md descriptions for every entry, overlapping the I/O.
+
+        Each read is independent and releases the GIL while blocked on disk,
+        so a small thread pool keeps the latency of a cold listing near that
+        of the slowest file instead of the sum of all of them. Warm entries
+        resolve from the mtime cache inside the workers without touching disk.
+        """
+        if len(entries) <= 1:
+            return {name: self._read_description_cached(path) for name, path in entries}
+        with ThreadPoolExecutor(max_workers=min(8, len(entries))) as executor:
+            return dict(
+                zip(
+                    (name for name, _ in entries),
+                    executor.map(
+                        self._read_description_cached, (path for _, path in entries)
+                    ),
+                )
+            )
+
+    def _read_description_cached(self, skill_md: Path) -> str:
+        """Parse the SKILL.md description, reusing it while the file's mtime holds."""
+        key = str(skill_md)
+        try:
+            mtime_ns = skill_md.stat().st_mtime_ns
+            cached = self._desc_cache.get(key)
+            if cached and cached[0] == mtime_ns:
+                return cached[1]
+            description = _parse_frontmatter_description(
+                _read_frontmatter_head(skill_md)
+            )
+        except Exception:
+            return ""
+        self._desc_cache[key] = (mtime_ns, description)
+        return description
+
     def is_sandbox_only_skill(self, name: str) -> bool:
         skill_dir = Path(self.skills_root) / name
         skill_md_exists = (skill_dir / "SKILL.md").exists()
@@ -352,8 +498,12 @@ class SkillManager:
                 "Sandbox preset skill cannot be enabled/disabled from local skill management."
             )
         config = self._load_config()
-        config.setdefault("skills", {})
-        config["skills"][name] = {"active": bool(active)}
+        skills = config.setdefault("skills", {})
+        entry = {"active": bool(active)}
+        if skills.get(name) == entry:
+            # Already in the requested state — don't rewrite the config.
+            return
+        skills[name] = entry
         self._save_config(config)
 
     def _remove_skill_from_sandbox_cache(self, name: str) -> None:
@@ -383,6 +533,7 @@ class SkillManager:
         skill_dir = Path(self.skills_root) / name
         if skill_dir.exists():
             shutil.rmtree(skill_dir)
+        self._desc_cache.pop(str(skill_dir / "SKILL.md"), None)
 
         # Ensure UI consistency even when there is no active sandbox session
         # to refresh cache from runtime side.
@@ -400,44 +551,78 @@ class SkillManager:
         if not zipfile.is_zipfile(zip_path):
             raise ValueError("Uploaded file is not a valid zip archive.")
 
-        with zipfile.ZipFile(zip_path) as zf:
-            names = [name.replace("\\", "/") for name in zf.namelist()]
-            file_names = [name for name in names if name and not name.endswith("/")]
-            if not file_names:
-                raise ValueError("Zip archive is empty.")
-
-            top_dirs = {
-                PurePosixPath(name).parts[0] for name in file_names if name.strip()
-            }
+        # Re-uploads of the same archive are common during development; key
+        # the validation result on the head digest + size so an already
+        # installed skill short-circuits the name-list walk and extraction.
+        digest = hashlib.blake2b(digest_size=16)
+        with open(zip_path, "rb") as f:
+            digest.update(f.read(65536))
+        cache_key = (digest.hexdigest(), zip_path_obj.stat().st_size)
+        cached_name = self._zip_validation_cache.get(cache_key)
+        if (
+            cached_name
+            and not overwrite
+            and (Path(self.skills_root) / cached_name).exists()
+        ):
+            return cached_name
 
-            if len(top_dirs) != 1:
-                raise ValueError("Zip archive must contain a single top-level folder.")
-            skill_name = next(iter(top_dirs))
-            if skill_name in {".", "..", ""} or not _SKILL_NAME_RE.match(skill_name):
-                raise ValueError("Invalid skill folder name.")
-
-            for name in names:
+        with zipfile.ZipFile(zip_path) as zf:
+            # One pass over the archive collects everything the checks below
+            # need instead of re-walking the name list per validation rule.
+            file_top_dirs: set[str] = set()
+            all_top_dirs: set[str] = set()
+            has_files = False
+            has_skill_md = False
+            has_absolute = False
+            has_parent_ref = False
+            for raw_name in zf.namelist():
+                name = raw_name.replace("\\", "/")
                 if not name:
                     continue
                 if name.startswith("/") or re.match(r"^[A-Za-z]:", name):
-                    raise ValueError("Zip archive contains absolute paths.")
+                    has_absolute = True
+                    continue
                 parts = PurePosixPath(name).parts
                 if ".." in parts:
-                    raise ValueError("Zip archive contains invalid relative paths.")
-                if parts and parts[0] != skill_name:
-                    raise ValueError(
-                        "Zip archive contains unexpected top-level entries."
-                    )
-
-            if (
-                f"{skill_name}/SKILL.md" not in file_names
-                and f"{skill_name}/skill.md" not in file_names
-            ):
+                    has_parent_ref = True
+                    continue
+                if not parts:
+                    continue
+                all_top_dirs.add(parts[0])
+                if name.endswith("/"):
+                    continue
+                has_files = True
+                file_top_dirs.add(parts[0])
+                if len(parts) == 2 and parts[1] in ("SKILL.md", "skill.md"):
+                    has_skill_md = True
+
+            if not has_files:
+                raise ValueError("Zip archive is empty.")
+            if len(file_top_dirs) != 1:
+                raise ValueError("Zip archive must contain a single top-level folder.")
+            skill_name = next(iter(file_top_dirs))
+            if skill_name in {".", "..", ""} or not _SKILL_NAME_RE.match(skill_name):
+                raise ValueError("Invalid skill folder name.")
+            if has_absolute:
+                raise ValueError("Zip archive contains absolute paths.")
+            if has_parent_ref:
+                raise ValueError("Zip archive contains invalid relative paths.")
+            if all_top_dirs != {skill_name}:
+                raise ValueError("Zip archive contains unexpected top-level entries.")
+            if not has_skill_md:
                 raise ValueError("SKILL.md not found in the skill folder.")
 
-            with tempfile.TemporaryDirectory(dir=get_astrbot_temp_path()) as tmp_dir:
-                zf.extractall(tmp_dir)
-                src_dir = Path(tmp_dir) / skill_name
+            # Stage the extraction inside the skills root so the final move is
+            # a same-filesystem rename; extracting to the temp dir made the
+            # move degrade to copy+delete whenever temp lives on another
+            # mount. The staged SKILL.md sits one level down, so a concurrent
+            # list_skills never picks the staging directory up.
+            staging_dir = Path(self.skills_root) / f".{skill_name}.staging"
+            if staging_dir.exists():
+                shutil.rmtree(staging_dir)
+            try:
+                zf.extractall(staging_dir)
+                src_dir = staging_dir / skill_name
                 if not src_dir.exists():
                     raise ValueError("Skill folder not found after extraction.")
                 dest_dir = Path(self.skills_root) / skill_name
@@ -445,7 +630,11 @@ class SkillManager:
                     if not overwrite:
                         raise FileExistsError("Skill already exists.")
                     shutil.rmtree(dest_dir)
-                shutil.move(str(src_dir), str(dest_dir))
+                os.rename(src_dir, dest_dir)
+                self._desc_cache.pop(str(dest_dir / "SKILL.md"), None)
+            finally:
+                shutil.rmtree(staging_dir, ignore_errors=True)
 
+        self._zip_validation_cache[cache_key] = skill_name
         self.set_skill_active(skill_name, True)
         return skill_name
@@ -4,64 +4,104 @@ _SECRET_KEYS = (
     r"(?:api_?key|access_?token|auth_?token|refresh_?token|session_?id|secret|password)"
 )
 
-_JSON_FIELD_PATTERN = re.compile(
-    rf"(?i)(?P<prefix>(?P<kq>['\"]){_SECRET_KEYS}(?P=kq)\s*:\s*)(?P<vq>['\"])(?P<value>[^'\"]+)(?P=vq)"
+# All key/value redaction rules fused into one alternation so a single scan
+# covers the whole text instead of one full pass (and one intermediate string)
+# per rule. Bare sk- tokens are handled separately by the linear scanner below.
+_REDACTION_PATTERN = re.compile(
+    "|".join(
+        (
+            rf"(?i:(?P<jf_prefix>(?P<jf_kq>['\"]){_SECRET_KEYS}(?P=jf_kq)\s*:\s*)(?P<jf_vq>['\"])[^'\"]+(?P=jf_vq))",
+            r"(?i:(?P<aj_prefix>(?P<aj_kq>['\"])authorization(?P=aj_kq)\s*:\s*)(?P<aj_vq>['\"])bearer\s+[^'\"]+(?P=aj_vq))",
+            rf"(?i:(?P<q_prefix>{_SECRET_KEYS}\s*=\s*)[^&'\" ]+)",
+            r"(?i:(?P<qp_prefix>[?&](?:api_?key|key|access_?token|auth_?token)=)[^&'\" ]+)",
+            r"(?i:(?P<ah_prefix>\bauthorization\s*:\s*bearer\s+)[A-Za-z0-9._\-]+)",
+            r"(?i:(?P<b_prefix>\bbearer\s+)[A-Za-z0-9._\-]+)",
+        )
+    )
 )
-_AUTH_JSON_FIELD_PATTERN = re.compile(
-    r"(?i)(?P<prefix>(?P<kq>['\"])authorization(?P=kq)\s*:\s*)(?P<vq>['\"])bearer\s+[^'\"]+(?P=vq)"
-)
-_QUERY_FIELD_PATTERN = re.compile(
-    rf"(?i)(?P<prefix>{_SECRET_KEYS}\s*=\s*)(?P<value>[^&'\" ]+)"
-)
-_QUERY_PARAM_PATTERN = re.compile(
-    r"(?i)(?P<prefix>[?&](?:api_?key|key|access_?token|auth_?token)=)(?P<value>[^&'\" ]+)"
-)
-_AUTH_HEADER_PATTERN = re.compile(
-    r"(?i)(?P<prefix>\bauthorization\s*:\s*bearer\s+)(?P<token>[A-Za-z0-9._\-]+)"
-)
-_BEARER_PATTERN = re.compile(r"(?i)(?P<prefix>\bbearer\s+)(?P<token>[A-Za-z0-9._\-]+)")
-_SK_PATTERN = re.compile(r"\bsk-[A-Za-z0-9]{16,}\b")
-
-
-def _redact_json_field(match: re.Match[str]) -> str:
-    quote = match.group("vq")
-    return f"{match.group('prefix')}{quote}[REDACTED]{quote}"
-
 
-def _redact_auth_json_field(match: re.Match[str]) -> str:
-    quote = match.group("vq")
-    return f"{match.group('prefix')}{quote}Bearer [REDACTED]{quote}"
-
-
-def _redact_prefixed_value(match: re.Match[str]) -> str:
-    return f"{match.group('prefix')}[REDACTED]"
-
-
-def _redact_bearer_token(match: re.Match[str]) -> str:
-    return f"{match.group('prefix')}[REDACTED]"
-
-
-def _redact_json_like(text: str) -> str:
-    text = _JSON_FIELD_PATTERN.sub(_redact_json_field, text)
-    return _AUTH_JSON_FIELD_PATTERN.sub(_redact_auth_json_field, text)
+# Minimum alphanumeric run after "sk-" for a token to be considered a secret
+# (mirrors the former regex rule ``\bsk-[A-Za-z0-9]{16,}\b``).
+_SK_MIN_RUN = 16
+
+
+def _is_ascii_alnum(char: str) -> bool:
+    return "0" <= char <= "9" or "A" <= char <= "Z" or "a" <= char <= "z"
+
+
+def _redact_sk(text: str) -> str:
+    """Replace bare ``sk-`` tokens via a linear ``str.find`` scan.
+
+    Equivalent to ``re.sub(r"\\bsk-[A-Za-z0-9]{16,}\\b", ...)`` but
+    short-circuits at strchr speed when no ``sk-`` occurs, which is the
+    common case for error strings.
+    """
+    start = text.find("sk-")
+    if start < 0:
+        return text
+    parts: list[str] = []
+    consumed = 0
+    length = len(text)
+    while start >= 0:
+        run_end = start + 3
+        while run_end < length and _is_ascii_alnum(text[run_end]):
+            run_end += 1
+        prev = text[start - 1] if start > 0 else ""
+        nxt = text[run_end] if run_end < length else ""
+        word_before = bool(prev) and (prev.isalnum() or prev == "_")
+        word_after = bool(nxt) and (nxt.isalnum() or nxt == "_")
+        if run_end - start - 3 >= _SK_MIN_RUN and not word_before and not word_after:
+            parts.append(text[consumed:start])
+            parts.append("[REDACTED]")
+            consumed = run_end
+            start = text.find("sk-", run_end)
+        else:
+            # A rejected probe may still contain a valid token further in
+            # (e.g. ``xsk-sk-<run>``), so only advance one position.
+            start = text.find("sk-", start + 1)
+    parts.append(text[consumed:])
+    return "".join(parts)
+
+
+# Substrings that every redaction alternative requires (lowercased). If none
+# occur in the text, the pattern cannot match and the scan can be skipped —
+# the overwhelmingly common case for error strings.
+_SECRET_TRIGGERS = (
+    "sk-",
+    "key",
+    "token",
+    "secret",
+    "password",
+    "session",
+    "authorization",
+    "bearer",
+)
 
 
-def _redact_query_like(text: str) -> str:
-    text = _QUERY_FIELD_PATTERN.sub(_redact_prefixed_value, text)
-    return _QUERY_PARAM_PATTERN.sub(_redact_prefixed_value, text)
+def _may_contain_secret(text: str) -> bool:
+    lowered = text.casefold()
+    return any(trigger in lowered for trigger in _SECRET_TRIGGERS)
 
 
-def _redact_tokens(text: str) -> str:
-    text = _AUTH_HEADER_PATTERN.sub(_redact_bearer_token, text)
-    text = _BEARER_PATTERN.sub(_redact_bearer_token, text)
-    return _SK_PATTERN.sub("[REDACTED]", text)
+def _redact_match(match: re.Match[str]) -> str:
+    groups = match.groupdict()
+    if groups["jf_prefix"] is not None:
+        quote = groups["jf_vq"]
+        return f"{groups['jf_prefix']}{quote}[REDACTED]{quote}"
+    if groups["aj_prefix"] is not None:
+        quote = groups["aj_vq"]
+        return f"{groups['aj_prefix']}{quote}Bearer [REDACTED]{quote}"
+    for key in ("q_prefix", "qp_prefix", "ah_prefix", "b_prefix"):
+        prefix = groups[key]
+        if prefix is not None:
+            return f"{prefix}[REDACTED]"
+    return "[REDACTED]"
 
 
 def redact_sensitive_text(text: str) -> str:
-    text = _redact_json_like(text)
-    text = _redact_query_like(text)
-    text = _redact_tokens(text)
-    return text
+    if not _may_contain_secret(text):
+        return text
+    return _redact_sk(_REDACTION_PATTERN.sub(_redact_match, text))
 
 
 def safe_error(
@@ -57,3 +57,19 @@ class Response:
         self.data = data
         self.message = message
         return self
+
+    @classmethod
+    def ok_dict(
+        cls, data: dict | list | None = None, message: str | None = None
+    ) -> dict:
+        """Shaped like ``Response().ok(...).__dict__`` without the object round-trip."""
+        return {
+            "status": "ok",
+            "message": message,
+            "data": {} if data is None else data,
+        }
+
+    @classmethod
+    def error_dict(cls, message: str) -> dict:
+        """Shaped like ``Response().error(...).__dict__`` without the object round-trip."""
+        return {"status": "error", "message": message, "data": None}
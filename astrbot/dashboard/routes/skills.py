@@ -1,7 +1,11 @@
+import asyncio
+import hashlib
 import os
-import re
 import shutil
-import traceback
+import string
+import tempfile
+import time
+import zipfile
 from collections.abc import Awaitable, Callable
 from pathlib import Path
 from typing import Any
@@ -19,31 +23,138 @@ from astrbot.core.utils.astrbot_path import get_astrbot_temp_path
 
 from .route import Response, Route, RouteContext
 
+# Values that can be emitted as-is; checked first because the bulk of any
+# Neo payload is leaf strings/numbers and recursing into them is pure waste.
+_JSON_PLAIN_TYPES = (str, int, float, bool, type(None))
+
 
 def _to_jsonable(value: Any) -> Any:
+    if isinstance(value, _JSON_PLAIN_TYPES):
+        return value
+    convert = _to_jsonable
     if isinstance(value, dict):
-        return {k: _to_jsonable(v) for k, v in value.items()}
+        return {k: convert(v) for k, v in value.items()}
     if isinstance(value, list):
-        return [_to_jsonable(v) for v in value]
+        return [convert(v) for v in value]
     if hasattr(value, "model_dump"):
-        return _to_jsonable(value.model_dump())
+        # Pydantic walks the whole model tree natively; the result is
+        # already JSON-shaped, so no second pass over it.
+        return value.model_dump(mode="json")
     return value
 
 
+# Accepted truthy string spellings; frozenset so membership is one hash
+# lookup against a constant rather than a set built per call.
+_TRUE_STRINGS = frozenset(("1", "true", "yes", "y", "on"))
+
+
 def _to_bool(value: Any, default: bool = False) -> bool:
+    if value is True or value is False:
+        return value
     if value is None:
         return default
-    if isinstance(value, bool):
-        return value
     if isinstance(value, str):
-        return value.strip().lower() in {"1", "true", "yes", "y", "on"}
+        # JSON payloads never pad these values; only strip when needed.
+        if value and (value[0].isspace() or value[-1].isspace()):
+            value = value.strip()
+        return value.lower() in _TRUE_STRINGS
     return bool(value)
 
 
-_SKILL_NAME_RE = re.compile(r"^[A-Za-z0-9._-]+$")
+# Allowed skill-name characters; set difference in C beats regex dispatch
+# for the short names this validates.
+_SKILL_NAME_CHARS = frozenset(string.ascii_letters + string.digits + "._-")
+
+
+def _is_valid_skill_name(name: str) -> bool:
+    return bool(name) and not (set(name) - _SKILL_NAME_CHARS)
+
+
+# Shared manager instances, created on first use so import order and test
+# environments stay unaffected. Both managers key their internal caches on
+# file mtimes, so reusing one instance across requests is what makes those
+# caches pay off; per-request construction threw them away every call.
+_skill_mgr: SkillManager | None = None
+_neo_sync_mgr: NeoSkillSyncManager | None = None
+
+
+def _get_skill_mgr() -> SkillManager:
+    global _skill_mgr
+    if _skill_mgr is None:
+        _skill_mgr = SkillManager()
+    return _skill_mgr
+
+
+def _get_neo_sync_mgr() -> NeoSkillSyncManager:
+    global _neo_sync_mgr
+    if _neo_sync_mgr is None:
+        _neo_sync_mgr = NeoSkillSyncManager()
+    return _neo_sync_mgr
+
+
+def _mtime_ns_or_zero(path) -> int:
+    try:
+        return os.stat(path).st_mtime_ns
+    except OSError:
+        return 0
+
+
+# Strong references to fire-and-forget sandbox sync tasks; asyncio only
+# keeps weak references, so tasks parked here survive until they finish.
+_bg_tasks: set[asyncio.Task] = set()
+
+# Coalescing state for sandbox syncs: at most one sync runs at a time, and a
+# burst of mutations while one is in flight collapses into a single trailing
+# re-sync (the sync pushes the full current skill set, so one pass after the
+# burst observes everything).
+_sync_lock = asyncio.Lock()
+_sync_queued = False
+
+
+async def _coalesced_sandbox_sync() -> None:
+    global _sync_queued
+    if _sync_lock.locked():
+        if _sync_queued:
+            return
+        _sync_queued = True
+    async with _sync_lock:
+        _sync_queued = False
+        await sync_skills_to_active_sandboxes()
+
+
+def _spawn_sandbox_sync(failure_message: str) -> None:
+    """Push local skills to active sandboxes without blocking the response.
+
+    The HTTP mutation has already happened; the sandbox push is
+    bookkeeping the caller does not need to wait for.
+    """
+    task = asyncio.create_task(_coalesced_sandbox_sync())
+    _bg_tasks.add(task)
+
+    def _log_failure(done: asyncio.Task) -> None:
+        _bg_tasks.discard(done)
+        if not done.cancelled() and done.exception() is not None:
+            logger.warning(failure_message)
+
+    task.add_done_callback(_log_failure)
+
+
+# Upper bound on in-flight Neo calls per batch request, so a large batch
+# amortizes the client connection without flooding the Neo server.
+_NEO_BATCH_CONCURRENCY = 8
+
+# How long a token discovered from Bay's credentials.json stays valid before
+# the filesystem probe runs again. Config edits in the dashboard bypass this
+# cache entirely because an explicitly configured token skips discovery.
+_CRED_DISCOVERY_TTL_S = 5.0
 
 
 class SkillsRoute(Route):
+    # Export zips keyed by skill name -> (directory signature, zip path),
+    # LRU-bounded; repeated downloads of an unchanged skill skip rebuilding.
+    _ZIP_CACHE_MAX = 32
+    _zip_cache: dict[str, tuple[str, Path]] = {}
+
     def __init__(self, context: RouteContext, core_lifecycle) -> None:
         super().__init__(context)
         self.core_lifecycle = core_lifecycle
@@ -55,28 +166,106 @@ class SkillsRoute(Route):
             "/skills/delete": ("POST", self.delete_skill),
             "/skills/neo/candidates": ("GET", self.get_neo_candidates),
             "/skills/neo/releases": ("GET", self.get_neo_releases),
+            "/skills/neo/overview": ("GET", self.get_neo_overview),
             "/skills/neo/payload": ("GET", self.get_neo_payload),
             "/skills/neo/evaluate": ("POST", self.evaluate_neo_candidate),
+            "/skills/neo/evaluate-batch": ("POST", self.evaluate_neo_candidates_batch),
             "/skills/neo/promote": ("POST", self.promote_neo_candidate),
             "/skills/neo/rollback": ("POST", self.rollback_neo_release),
             "/skills/neo/sync": ("POST", self.sync_neo_release),
             "/skills/neo/delete-candidate": ("POST", self.delete_neo_candidate),
+            "/skills/neo/delete-candidates-batch": (
+                "POST",
+                self.delete_neo_candidates_batch,
+            ),
             "/skills/neo/delete-release": ("POST", self.delete_neo_release),
         }
+        # One BayClient shared across requests so polled Neo endpoints reuse
+        # the underlying connection pool instead of paying a TCP+TLS
+        # handshake per call. Rebuilt when the endpoint/token change.
+        self._neo_client: Any = None
+        self._neo_client_key: tuple[str, str] | None = None
+        self._neo_client_lock = asyncio.Lock()
+        # (monotonic deadline, endpoint, token) from credentials.json probing.
+        self._discovered_token_cache: tuple[float, str, str] | None = None
+        # (config file mtime, endpoint, configured token); every config
+        # mutation goes through save_config and rewrites the file, so the
+        # mtime doubles as a version counter and the nested dict traversal
+        # only reruns after an actual config change.
+        self._neo_cfg_cache: tuple[int, str, str] | None = None
+        # Rendered /skills response keyed by (runtime, mtimes of the skills
+        # root, skills.json and sandbox cache) — the dashboard polls this
+        # endpoint, and those mtimes cover every mutation the listing shows.
+        self._skills_response_cache: tuple[tuple, dict] | None = None
+        self.app.after_serving(self._close_neo_client)
         self.register_routes()
 
-    def _get_neo_client_config(self) -> tuple[str, str]:
-        provider_settings = self.core_lifecycle.astrbot_config.get(
-            "provider_settings",
-            {},
-        )
-        sandbox = provider_settings.get("sandbox", {})
-        endpoint = sandbox.get("shipyard_neo_endpoint", "")
-        access_token = sandbox.get("shipyard_neo_access_token", "")
+    async def _close_neo_client(self) -> None:
+        async with self._neo_client_lock:
+            client, self._neo_client, self._neo_client_key = (
+                self._neo_client,
+                None,
+                None,
+            )
+        if client is not None:
+            try:
+                await client.__aexit__(None, None, None)
+            except Exception:
+                logger.warning("[Neo] Failed to close BayClient cleanly.")
+
+    async def _get_neo_client(self, endpoint: str, access_token: str) -> Any:
+        """Return the shared BayClient, (re)opening it when config changes."""
+        key = (endpoint, access_token)
+        async with self._neo_client_lock:
+            if self._neo_client is not None and self._neo_client_key == key:
+                return self._neo_client
+            stale, self._neo_client, self._neo_client_key = (
+                self._neo_client,
+                None,
+                None,
+            )
+            if stale is not None:
+                try:
+                    await stale.__aexit__(None, None, None)
+                except Exception:
+                    logger.warning("[Neo] Failed to close stale BayClient.")
+
+            from shipyard_neo import BayClient
 
-        # Auto-discover token from Bay's credentials.json if not configured
+            client = BayClient(endpoint_url=endpoint, access_token=access_token)
+            await client.__aenter__()
+            self._neo_client = client
+            self._neo_client_key = key
+            return client
+
+    def _get_neo_client_config(self) -> tuple[str, str]:
+        astrbot_config = self.core_lifecycle.astrbot_config
+        cfg_version = _mtime_ns_or_zero(astrbot_config.config_path)
+        cached_cfg = self._neo_cfg_cache
+        if cached_cfg and cached_cfg[0] == cfg_version:
+            endpoint, access_token = cached_cfg[1], cached_cfg[2]
+        else:
+            provider_settings = astrbot_config.get("provider_settings", {})
+            sandbox = provider_settings.get("sandbox", {})
+            endpoint = sandbox.get("shipyard_neo_endpoint", "")
+            access_token = sandbox.get("shipyard_neo_access_token", "")
+            self._neo_cfg_cache = (cfg_version, endpoint, access_token)
+
+        # Auto-discover token from Bay's credentials.json if not configured.
+        # The probe opens and parses a file, so its result is held for a few
+        # seconds instead of hitting disk on every polled Neo request.
         if not access_token and endpoint:
-            access_token = _discover_bay_credentials(endpoint)
+            now = time.monotonic()
+            cached = self._discovered_token_cache
+            if cached and cached[0] > now and cached[1] == endpoint:
+                access_token = cached[2]
+            else:
+                access_token = _discover_bay_credentials(endpoint)
+                self._discovered_token_cache = (
+                    now + _CRED_DISCOVERY_TTL_S,
+                    endpoint,
+                    access_token,
+                )
 
         if not endpoint or not access_token:
             raise ValueError(
@@ -95,27 +284,53 @@ class SkillsRoute(Route):
     ):
         return await client.skills.delete_candidate(candidate_id, reason=reason)
 
+    @staticmethod
+    async def _gather_neo_batch(
+        ids: list, operation: Callable[[str], Awaitable[Any]]
+    ) -> tuple[list[dict], int]:
+        """Fan ``operation`` out over ``ids`` with bounded concurrency.
+
+        Per-id failures are reported in the result list instead of failing
+        the whole batch.
+        """
+        semaphore = asyncio.Semaphore(_NEO_BATCH_CONCURRENCY)
+
+        async def _one(item_id: str):
+            async with semaphore:
+                return await operation(item_id)
+
+        raw = await asyncio.gather(
+            *(_one(item_id) for item_id in ids), return_exceptions=True
+        )
+        results: list[dict] = []
+        failed = 0
+        for item_id, result in zip(ids, raw):
+            if isinstance(result, BaseException):
+                failed += 1
+                results.append(
+                    {"id": item_id, "status": "error", "message": str(result)}
+                )
+            else:
+                results.append(
+                    {"id": item_id, "status": "ok", "result": _to_jsonable(result)}
+                )
+        return results, failed
+
     async def _with_neo_client(
         self,
         operation: Callable[[Any], Awaitable[dict]],
     ) -> dict:
         try:
             endpoint, access_token = self._get_neo_client_config()
-
-            from shipyard_neo import BayClient
-
-            async with BayClient(
-                endpoint_url=endpoint,
-                access_token=access_token,
-            ) as client:
-                return await operation(client)
+            client = await self._get_neo_client(endpoint, access_token)
+            return await operation(client)
         except ValueError as e:
             # Config not ready — expected when Neo isn't set up yet
             logger.debug("[Neo] %s", e)
-            return Response().error(str(e)).__dict__
+            return Response.error_dict(str(e))
         except Exception as e:
-            logger.error(traceback.format_exc())
-            return Response().error(str(e)).__dict__
+            logger.exception("[Neo] Request failed.")
+            return Response.error_dict(str(e))
 
     async def get_skills(self):
         try:
@@ -123,31 +338,60 @@ class SkillsRoute(Route):
                 "provider_settings", {}
             )
             runtime = provider_settings.get("computer_use_runtime", "local")
-            skill_mgr = SkillManager()
-            skills = skill_mgr.list_skills(
-                active_only=False, runtime=runtime, show_sandbox_path=False
-            )
-            return (
-                Response()
-                .ok(
-                    {
-                        "skills": [skill.__dict__ for skill in skills],
-                        "runtime": runtime,
-                        "sandbox_cache": skill_mgr.get_sandbox_skills_cache_status(),
-                    }
-                )
-                .__dict__
+            skill_mgr = _get_skill_mgr()
+            cache_key = (
+                runtime,
+                _mtime_ns_or_zero(skill_mgr.skills_root),
+                _mtime_ns_or_zero(skill_mgr.config_path),
+                _mtime_ns_or_zero(skill_mgr.sandbox_skills_cache_path),
             )
+            cached = self._skills_response_cache
+            if cached and cached[0] == cache_key:
+                return dict(cached[1])
+            skills = await asyncio.to_thread(
+                skill_mgr.list_skills,
+                active_only=False,
+                runtime=runtime,
+                show_sandbox_path=False,
+            )
+            sandbox_cache = await asyncio.to_thread(
+                skill_mgr.get_sandbox_skills_cache_status
+            )
+            payload = Response.ok_dict(
+                {
+                    "skills": [skill.to_dict() for skill in skills],
+                    "runtime": runtime,
+                    "sandbox_cache": sandbox_cache,
+                }
+            )
+            self._skills_response_cache = (cache_key, payload)
+            return payload
         except Exception as e:
-            logger.error(traceback.format_exc())
-            return Response().error(str(e)).__dict__
+            logger.exception("Failed to list skills.")
+            return Response.error_dict(str(e))
+
+    @staticmethod
+    def _persist_upload(file: Any, temp_dir: str) -> str:
+        """Copy a parsed upload into ``temp_dir``; runs on a worker thread.
+
+        Quart already spools large multipart bodies to disk, so the only
+        remaining cost is this copy. ``FileStorage.save`` drains the spool
+        in 16 KiB async writes on the event loop; ``copyfileobj`` with a
+        1 MiB buffer does the same work at C speed without stalling other
+        requests. ``mkstemp`` picks the destination name so concurrent
+        uploads of the same filename cannot clobber each other's temp file.
+        """
+        os.makedirs(temp_dir, exist_ok=True)
+        fd, temp_path = tempfile.mkstemp(dir=temp_dir, suffix=".zip")
+        file.stream.seek(0)
+        with os.fdopen(fd, "wb") as out:
+            shutil.copyfileobj(file.stream, out, 1024 * 1024)
+        return temp_path
 
     async def upload_skill(self):
         if DEMO_MODE:
-            return (
-                Response()
-                .error("You are not permitted to do this operation in demo mode")
-                .__dict__
+            return Response.error_dict(
+                "You are not permitted to do this operation in demo mode"
             )
 
         temp_path = None
@@ -155,133 +399,163 @@ class SkillsRoute(Route):
             files = await request.files
             file = files.get("file")
             if not file:
-                return Response().error("Missing file").__dict__
+                return Response.error_dict("Missing file")
             filename = os.path.basename(file.filename or "skill.zip")
             if not filename.lower().endswith(".zip"):
-                return Response().error("Only .zip files are supported").__dict__
+                return Response.error_dict("Only .zip files are supported")
 
             temp_dir = get_astrbot_temp_path()
-            os.makedirs(temp_dir, exist_ok=True)
-            temp_path = os.path.join(temp_dir, filename)
-            await file.save(temp_path)
+            temp_path = await asyncio.to_thread(self._persist_upload, file, temp_dir)
 
-            skill_mgr = SkillManager()
-            skill_name = skill_mgr.install_skill_from_zip(temp_path, overwrite=True)
+            skill_mgr = _get_skill_mgr()
+            skill_name = await asyncio.to_thread(
+                skill_mgr.install_skill_from_zip, temp_path, overwrite=True
+            )
 
-            try:
-                await sync_skills_to_active_sandboxes()
-            except Exception:
-                logger.warning("Failed to sync uploaded skills to active sandboxes.")
+            _spawn_sandbox_sync("Failed to sync uploaded skills to active sandboxes.")
 
-            return (
-                Response()
-                .ok({"name": skill_name}, "Skill uploaded successfully.")
-                .__dict__
+            return Response.ok_dict(
+                {"name": skill_name}, "Skill uploaded successfully."
             )
         except Exception as e:
-            logger.error(traceback.format_exc())
-            return Response().error(str(e)).__dict__
+            logger.exception("Failed to upload skill.")
+            return Response.error_dict(str(e))
         finally:
-            if temp_path and os.path.exists(temp_path):
+            if temp_path:
                 try:
-                    os.remove(temp_path)
-                except Exception:
+                    Path(temp_path).unlink(missing_ok=True)
+                except OSError:
                     logger.warning(f"Failed to remove temp skill file: {temp_path}")
 
+    @staticmethod
+    def _skill_dir_signature(skill_dir: Path) -> str:
+        """Hash the (path, mtime, size) listing of a skill directory."""
+        digest = hashlib.blake2b(digest_size=16)
+        for entry in sorted(skill_dir.rglob("*")):
+            stat = entry.stat()
+            digest.update(
+                f"{entry.relative_to(skill_dir).as_posix()}\0"
+                f"{stat.st_mtime_ns}\0{stat.st_size}\0".encode()
+            )
+        return digest.hexdigest()
+
+    @staticmethod
+    def _build_skill_zip(zip_path: Path, skill_dir: Path, name: str) -> None:
+        """Archive a skill directory to ``zip_path``; runs on a worker thread.
+
+        Uses ``ZIP_STORED`` — skill bundles are small and downloads are
+        local, so compressing them only burns CPU. The archive is staged
+        next to the target and published with ``os.replace`` so a
+        concurrent download never sees a half-written zip.
+        """
+        tmp_path = zip_path.with_name(zip_path.name + ".tmp")
+        with zipfile.ZipFile(tmp_path, "w", zipfile.ZIP_STORED) as zf:
+            for entry in sorted(skill_dir.rglob("*")):
+                arcname = f"{name}/{entry.relative_to(skill_dir).as_posix()}"
+                zf.write(entry, arcname)
+        os.replace(tmp_path, zip_path)
+
     async def download_skill(self):
         try:
             name = str(request.args.get("name") or "").strip()
             if not name:
-                return Response().error("Missing skill name").__dict__
-            if not _SKILL_NAME_RE.match(name):
-                return Response().error("Invalid skill name").__dict__
-
-            skill_mgr = SkillManager()
-            if skill_mgr.is_sandbox_only_skill(name):
-                return (
-                    Response()
-                    .error(
-                        "Sandbox preset skill cannot be downloaded from local skill files."
-                    )
-                    .__dict__
+                return Response.error_dict("Missing skill name")
+            if not _is_valid_skill_name(name):
+                return Response.error_dict("Invalid skill name")
+
+            skill_mgr = _get_skill_mgr()
+            if await asyncio.to_thread(skill_mgr.is_sandbox_only_skill, name):
+                return Response.error_dict(
+                    "Sandbox preset skill cannot be downloaded from local skill files."
                 )
 
             skill_dir = Path(skill_mgr.skills_root) / name
             skill_md = skill_dir / "SKILL.md"
             if not skill_dir.is_dir() or not skill_md.exists():
-                return Response().error("Local skill not found").__dict__
+                return Response.error_dict("Local skill not found")
 
             export_dir = Path(get_astrbot_temp_path()) / "skill_exports"
             export_dir.mkdir(parents=True, exist_ok=True)
-            zip_base = export_dir / name
-            zip_path = zip_base.with_suffix(".zip")
-            if zip_path.exists():
-                zip_path.unlink()
-
-            shutil.make_archive(
-                str(zip_base),
-                "zip",
-                root_dir=str(skill_mgr.skills_root),
-                base_dir=name,
-            )
-
-            return await send_file(
+            zip_path = export_dir / f"{name}.zip"
+
+            # A dashboard refresh commonly re-downloads an unchanged skill;
+            # skip the rebuild when the directory signature still matches.
+            signature = await asyncio.to_thread(self._skill_dir_signature, skill_dir)
+            cached = self._zip_cache.pop(name, None)
+            if cached and cached[0] == signature and zip_path.exists():
+                self._zip_cache[name] = cached
+            else:
+                await asyncio.to_thread(
+                    self._build_skill_zip, zip_path, skill_dir, name
+                )
+                self._zip_cache[name] = (signature, zip_path)
+                while len(self._zip_cache) > self._ZIP_CACHE_MAX:
+                    # Insertion order doubles as LRU order: hits re-insert
+                    # above, so the first key is always the coldest.
+                    _, stale_zip = self._zip_cache.pop(next(iter(self._zip_cache)))
+                    stale_zip.unlink(missing_ok=True)
+
+            response = await send_file(
                 str(zip_path),
                 as_attachment=True,
                 attachment_filename=f"{name}.zip",
                 conditional=True,
             )
+            # Quart's FileBody defaults to 8 KiB reads, each a thread-pool
+            # round-trip through aiofiles; 1 MiB chunks send the same bytes
+            # in a handful of iterations. (True sendfile(2) is out of reach
+            # here — under ASGI the app never holds the socket fd.)
+            if hasattr(response.response, "buffer_size"):
+                response.response.buffer_size = 1024 * 1024
+            return response
         except Exception as e:
-            logger.error(traceback.format_exc())
-            return Response().error(str(e)).__dict__
+            logger.exception("Failed to export skill.")
+            return Response.error_dict(str(e))
 
     async def update_skill(self):
         if DEMO_MODE:
-            return (
-                Response()
-                .error("You are not permitted to do this operation in demo mode")
-                .__dict__
+            return Response.error_dict(
+                "You are not permitted to do this operation in demo mode"
             )
         try:
             data = await request.get_json()
             name = data.get("name")
             active = data.get("active", True)
             if not name:
-                return Response().error("Missing skill name").__dict__
-            SkillManager().set_skill_active(name, bool(active))
-            return Response().ok({"name": name, "active": bool(active)}).__dict__
+                return Response.error_dict("Missing skill name")
+            await asyncio.to_thread(
+                _get_skill_mgr().set_skill_active, name, bool(active)
+            )
+            return Response.ok_dict({"name": name, "active": bool(active)})
         except Exception as e:
-            logger.error(traceback.format_exc())
-            return Response().error(str(e)).__dict__
+            logger.exception("Failed to update skill.")
+            return Response.error_dict(str(e))
 
     async def delete_skill(self):
         if DEMO_MODE:
-            return (
-                Response()
-                .error("You are not permitted to do this operation in demo mode")
-                .__dict__
+            return Response.error_dict(
+                "You are not permitted to do this operation in demo mode"
             )
         try:
             data = await request.get_json()
             name = data.get("name")
             if not name:
-                return Response().error("Missing skill name").__dict__
-            SkillManager().delete_skill(name)
-            try:
-                await sync_skills_to_active_sandboxes()
-            except Exception:
-                logger.warning("Failed to sync deleted skills to active sandboxes.")
-            return Response().ok({"name": name}).__dict__
+                return Response.error_dict("Missing skill name")
+            await asyncio.to_thread(_get_skill_mgr().delete_skill, name)
+            _spawn_sandbox_sync("Failed to sync deleted skills to active sandboxes.")
+            return Response.ok_dict({"name": name})
         except Exception as e:
-            logger.error(traceback.format_exc())
-            return Response().error(str(e)).__dict__
+            logger.exception("Failed to delete skill.")
+            return Response.error_dict(str(e))
 
     async def get_neo_candidates(self):
         logger.info("[Neo] GET /skills/neo/candidates requested.")
         status = request.args.get("status")
         skill_key = request.args.get("skill_key")
-        limit = int(request.args.get("limit", 100))
-        offset = int(request.args.get("offset", 0))
+        # type=int converts in Werkzeug and falls back to the default on bad
+        # input instead of raising through the generic handler.
+        limit = max(1, min(request.args.get("limit", default=100, type=int), 500))
+        offset = max(0, request.args.get("offset", default=0, type=int))
 
         async def _do(client):
             candidates = await client.skills.list_candidates(
@@ -290,10 +564,13 @@ class SkillsRoute(Route):
                 limit=limit,
                 offset=offset,
             )
-            result = _to_jsonable(candidates)
-            total = result.get("total", "?") if isinstance(result, dict) else "?"
+            # No conversion pass: the app's JSON provider serializes pydantic
+            # models natively, so the raw client result goes straight out.
+            total = (
+                candidates.get("total", "?") if isinstance(candidates, dict) else "?"
+            )
             logger.info(f"[Neo] Candidates fetched: total={total}")
-            return Response().ok(result).__dict__
+            return Response.ok_dict(candidates)
 
         return await self._with_neo_client(_do)
 
@@ -302,8 +579,10 @@ class SkillsRoute(Route):
         skill_key = request.args.get("skill_key")
         stage = request.args.get("stage")
         active_only = _to_bool(request.args.get("active_only"), False)
-        limit = int(request.args.get("limit", 100))
-        offset = int(request.args.get("offset", 0))
+        # type=int converts in Werkzeug and falls back to the default on bad
+        # input instead of raising through the generic handler.
+        limit = max(1, min(request.args.get("limit", default=100, type=int), 500))
+        offset = max(0, request.args.get("offset", default=0, type=int))
 
         async def _do(client):
             releases = await client.skills.list_releases(
@@ -313,10 +592,53 @@ class SkillsRoute(Route):
                 limit=limit,
                 offset=offset,
             )
-            result = _to_jsonable(releases)
-            total = result.get("total", "?") if isinstance(result, dict) else "?"
+            total = releases.get("total", "?") if isinstance(releases, dict) else "?"
             logger.info(f"[Neo] Releases fetched: total={total}")
-            return Response().ok(result).__dict__
+            return Response.ok_dict(releases)
+
+        return await self._with_neo_client(_do)
+
+    async def get_neo_overview(self):
+        """Fetch candidates and releases in one request.
+
+        The dashboard loads both lists on entry; issuing the two Neo calls
+        concurrently costs max(RTT) instead of their sum and saves one
+        browser round-trip.
+        """
+        logger.info("[Neo] GET /skills/neo/overview requested.")
+        status = request.args.get("status")
+        skill_key = request.args.get("skill_key")
+        stage = request.args.get("stage")
+        active_only = _to_bool(request.args.get("active_only"), False)
+        # type=int converts in Werkzeug and falls back to the default on bad
+        # input instead of raising through the generic handler.
+        limit = max(1, min(request.args.get("limit", default=100, type=int), 500))
+        offset = max(0, request.args.get("offset", default=0, type=int))
+
+        async def _do(client):
+            candidates, releases = await asyncio.gather(
+                client.skills.list_candidates(
+                    status=status,
+                    skill_key=skill_key,
+                    limit=limit,
+                    offset=offset,
+                ),
+                client.skills.list_releases(
+                    skill_key=skill_key,
+                    active_only=active_only,
+                    stage=stage,
+                    limit=limit,
+                    offset=offset,
+                ),
+                return_exceptions=True,
+            )
+            # One side failing shouldn't blank the other; report per-list.
+            if isinstance(candidates, BaseException):
+                candidates = {"error": str(candidates)}
+            if isinstance(releases, BaseException):
+                releases = {"error": str(releases)}
+            logger.info("[Neo] Overview fetched.")
+            return Response.ok_dict({"candidates": candidates, "releases": releases})
 
         return await self._with_neo_client(_do)
 
@@ -324,28 +646,26 @@ class SkillsRoute(Route):
         logger.info("[Neo] GET /skills/neo/payload requested.")
         payload_ref = request.args.get("payload_ref", "")
         if not payload_ref:
-            return Response().error("Missing payload_ref").__dict__
+            return Response.error_dict("Missing payload_ref")
 
         async def _do(client):
             payload = await client.skills.get_payload(payload_ref)
             logger.info(f"[Neo] Payload fetched: ref={payload_ref}")
-            return Response().ok(_to_jsonable(payload)).__dict__
+            return Response.ok_dict(_to_jsonable(payload))
 
         return await self._with_neo_client(_do)
 
     async def evaluate_neo_candidate(self):
         if DEMO_MODE:
-            return (
-                Response()
-                .error("You are not permitted to do this operation in demo mode")
-                .__dict__
+            return Response.error_dict(
+                "You are not permitted to do this operation in demo mode"
             )
         logger.info("[Neo] POST /skills/neo/evaluate requested.")
         data = await request.get_json()
         candidate_id = data.get("candidate_id")
         passed_value = data.get("passed")
         if not candidate_id or passed_value is None:
-            return Response().error("Missing candidate_id or passed").__dict__
+            return Response.error_dict("Missing candidate_id or passed")
         passed = _to_bool(passed_value, False)
 
         async def _do(client):
@@ -359,16 +679,46 @@ class SkillsRoute(Route):
             logger.info(
                 f"[Neo] Candidate evaluated: id={candidate_id}, passed={passed}"
             )
-            return Response().ok(_to_jsonable(result)).__dict__
+            return Response.ok_dict(_to_jsonable(result))
+
+        return await self._with_neo_client(_do)
+
+    async def evaluate_neo_candidates_batch(self):
+        if DEMO_MODE:
+            return Response.error_dict(
+                "You are not permitted to do this operation in demo mode"
+            )
+        logger.info("[Neo] POST /skills/neo/evaluate-batch requested.")
+        data = await request.get_json()
+        ids = data.get("ids")
+        passed_value = data.get("passed")
+        if not ids or not isinstance(ids, list) or passed_value is None:
+            return Response.error_dict("Missing ids or passed")
+        passed = _to_bool(passed_value, False)
+
+        async def _do(client):
+            results, failed = await self._gather_neo_batch(
+                ids,
+                lambda candidate_id: client.skills.evaluate_candidate(
+                    candidate_id,
+                    passed=passed,
+                    score=data.get("score"),
+                    benchmark_id=data.get("benchmark_id"),
+                    report=data.get("report"),
+                ),
+            )
+            logger.info(
+                f"[Neo] Candidates evaluated in batch: total={len(ids)}, "
+                f"failed={failed}, passed={passed}"
+            )
+            return Response.ok_dict({"results": results, "failed": failed})
 
         return await self._with_neo_client(_do)
 
     async def promote_neo_candidate(self):
         if DEMO_MODE:
-            return (
-                Response()
-                .error("You are not permitted to do this operation in demo mode")
-                .__dict__
+            return Response.error_dict(
+                "You are not permitted to do this operation in demo mode"
             )
         logger.info("[Neo] POST /skills/neo/promote requested.")
         data = await request.get_json()
@@ -376,12 +726,12 @@ class SkillsRoute(Route):
         stage = data.get("stage", "canary")
         sync_to_local = _to_bool(data.get("sync_to_local"), True)
         if not candidate_id:
-            return Response().error("Missing candidate_id").__dict__
+            return Response.error_dict("Missing candidate_id")
         if stage not in {"canary", "stable"}:
-            return Response().error("Invalid stage, must be canary/stable").__dict__
+            return Response.error_dict("Invalid stage, must be canary/stable")
 
         async def _do(client):
-            sync_mgr = NeoSkillSyncManager()
+            sync_mgr = _get_neo_sync_mgr()
             result = await sync_mgr.promote_with_optional_sync(
                 client,
                 candidate_id=candidate_id,
@@ -399,53 +749,55 @@ class SkillsRoute(Route):
                 )
 
             if result.get("sync_error"):
-                resp = Response().error(
+                resp = Response.error_dict(
                     "Stable promote synced failed and has been rolled back. "
                     f"sync_error={result['sync_error']}"
                 )
-                resp.data = {
+                resp["data"] = {
                     "release": release_json,
                     "rollback": result.get("rollback"),
                 }
-                return resp.__dict__
+                return resp
 
             # Try to push latest local skills to all active sandboxes.
             if not did_sync_to_local:
-                try:
-                    await sync_skills_to_active_sandboxes()
-                except Exception:
-                    logger.warning("Failed to sync skills to active sandboxes.")
+                _spawn_sandbox_sync("Failed to sync skills to active sandboxes.")
 
-            return Response().ok({"release": release_json, "sync": sync_json}).__dict__
+            return Response.ok_dict({"release": release_json, "sync": sync_json})
 
         return await self._with_neo_client(_do)
 
     async def rollback_neo_release(self):
         if DEMO_MODE:
-            return (
-                Response()
-                .error("You are not permitted to do this operation in demo mode")
-                .__dict__
+            return Response.error_dict(
+                "You are not permitted to do this operation in demo mode"
             )
         logger.info("[Neo] POST /skills/neo/rollback requested.")
         data = await request.get_json()
         release_id = data.get("release_id")
         if not release_id:
-            return Response().error("Missing release_id").__dict__
+            return Response.error_dict("Missing release_id")
 
         async def _do(client):
             result = await client.skills.rollback_release(release_id)
+            result_json = _to_jsonable(result)
+            # A rollback changes which release is active for this skill;
+            # drop cached lookups that could now report a stale stage.
+            _get_neo_sync_mgr().invalidate_release_cache(
+                release_id=str(release_id),
+                skill_key=result_json.get("skill_key")
+                if isinstance(result_json, dict)
+                else None,
+            )
             logger.info(f"[Neo] Release rolled back: id={release_id}")
-            return Response().ok(_to_jsonable(result)).__dict__
+            return Response.ok_dict(result_json)
 
         return await self._with_neo_client(_do)
 
     async def sync_neo_release(self):
         if DEMO_MODE:
-            return (
-                Response()
-                .error("You are not permitted to do this operation in demo mode")
-                .__dict__
+            return Response.error_dict(
+                "You are not permitted to do this operation in demo mode"
             )
         logger.info("[Neo] POST /skills/neo/sync requested.")
         data = await request.get_json()
@@ -453,10 +805,10 @@ class SkillsRoute(Route):
         skill_key = data.get("skill_key")
         require_stable = _to_bool(data.get("require_stable"), True)
         if not release_id and not skill_key:
-            return Response().error("Missing release_id or skill_key").__dict__
+            return Response.error_dict("Missing release_id or skill_key")
 
         async def _do(client):
-            sync_mgr = NeoSkillSyncManager()
+            sync_mgr = _get_neo_sync_mgr()
             result = await sync_mgr.sync_release(
                 client,
                 release_id=release_id,
@@ -467,62 +819,80 @@ class SkillsRoute(Route):
                 f"[Neo] Release synced to local: skill={result.local_skill_name}, "
                 f"release_id={result.release_id}"
             )
-            return (
-                Response()
-                .ok(
-                    {
-                        "skill_key": result.skill_key,
-                        "local_skill_name": result.local_skill_name,
-                        "release_id": result.release_id,
-                        "candidate_id": result.candidate_id,
-                        "payload_ref": result.payload_ref,
-                        "map_path": result.map_path,
-                        "synced_at": result.synced_at,
-                    }
-                )
-                .__dict__
+            return Response.ok_dict(
+                {
+                    "skill_key": result.skill_key,
+                    "local_skill_name": result.local_skill_name,
+                    "release_id": result.release_id,
+                    "candidate_id": result.candidate_id,
+                    "payload_ref": result.payload_ref,
+                    "map_path": result.map_path,
+                    "synced_at": result.synced_at,
+                }
             )
 
         return await self._with_neo_client(_do)
 
     async def delete_neo_candidate(self):
         if DEMO_MODE:
-            return (
-                Response()
-                .error("You are not permitted to do this operation in demo mode")
-                .__dict__
+            return Response.error_dict(
+                "You are not permitted to do this operation in demo mode"
             )
         logger.info("[Neo] POST /skills/neo/delete-candidate requested.")
         data = await request.get_json()
         candidate_id = data.get("candidate_id")
         reason = data.get("reason")
         if not candidate_id:
-            return Response().error("Missing candidate_id").__dict__
+            return Response.error_dict("Missing candidate_id")
 
         async def _do(client):
             result = await self._delete_neo_candidate(client, candidate_id, reason)
             logger.info(f"[Neo] Candidate deleted: id={candidate_id}")
-            return Response().ok(_to_jsonable(result)).__dict__
+            return Response.ok_dict(_to_jsonable(result))
+
+        return await self._with_neo_client(_do)
+
+    async def delete_neo_candidates_batch(self):
+        if DEMO_MODE:
+            return Response.error_dict(
+                "You are not permitted to do this operation in demo mode"
+            )
+        logger.info("[Neo] POST /skills/neo/delete-candidates-batch requested.")
+        data = await request.get_json()
+        ids = data.get("ids")
+        reason = data.get("reason")
+        if not ids or not isinstance(ids, list):
+            return Response.error_dict("Missing ids")
+
+        async def _do(client):
+            results, failed = await self._gather_neo_batch(
+                ids,
+                lambda candidate_id: self._delete_neo_candidate(
+                    client, candidate_id, reason
+                ),
+            )
+            logger.info(
+                f"[Neo] Candidates deleted in batch: total={len(ids)}, failed={failed}"
+            )
+            return Response.ok_dict({"results": results, "failed": failed})
 
         return await self._with_neo_client(_do)
 
     async def delete_neo_release(self):
         if DEMO_MODE:
-            return (
-                Response()
-                .error("You are not permitted to do this operation in demo mode")
-                .__dict__
+            return Response.error_dict(
+                "You are not permitted to do this operation in demo mode"
             )
         logger.info("[Neo] POST /skills/neo/delete-release requested.")
         data = await request.get_json()
         release_id = data.get("release_id")
         reason = data.get("reason")
         if not release_id:
-            return Response().error("Missing release_id").__dict__
+            return Response.error_dict("Missing release_id")
 
         async def _do(client):
             result = await self._delete_neo_release(client, release_id, reason)
             logger.info(f"[Neo] Release deleted: id={release_id}")
-            return Response().ok(_to_jsonable(result)).__dict__
+            return Response.ok_dict(_to_jsonable(result))
 
         return await self._with_neo_client(_do)
@@ -10,6 +10,11 @@ from typing import Protocol, cast
 import jwt
 import psutil
 from flask.json.provider import DefaultJSONProvider
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
 from hypercorn.asyncio import serve
 from hypercorn.config import Config as HyperConfig
 from quart import Quart, g, jsonify, request
@@ -54,8 +59,34 @@ class AstrBotJSONProvider(DefaultJSONProvider):
     def default(self, obj):
         if isinstance(obj, datetime):
             return to_utc_isoformat(obj)
+        if hasattr(obj, "model_dump"):
+            # Pydantic models serialize through pydantic-core directly,
+            # so route handlers can return them without a Python-level
+            # conversion walk first.
+            return obj.model_dump(mode="json")
         return super().default(obj)
 
+    def dumps(self, obj, **kwargs):
+        # Large API payloads (plugin lists, Neo release listings) go through
+        # here on every response. Outside debug mode Quart always asks for
+        # compact separators, which is orjson's only output form, so that
+        # case takes the C serializer; debug-mode indent (or any other
+        # explicit dump option) keeps the stdlib path. Datetimes are passed
+        # through to default() so they keep the UTC normalization instead of
+        # orjson's native naive-datetime output.
+        if orjson is not None and (not kwargs or kwargs == {"separators": (",", ":")}):
+            return orjson.dumps(
+                obj,
+                default=self.default,
+                option=orjson.OPT_NON_STR_KEYS | orjson.OPT_PASSTHROUGH_DATETIME,
+            ).decode()
+        return super().dumps(obj, **kwargs)
+
+    def loads(self, s, **kwargs):
+        if orjson is not None and not kwargs:
+            return orjson.loads(s)
+        return super().loads(s, **kwargs)
+
 
 class AstrBotDashboard:
     def __init__(
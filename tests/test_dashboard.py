@@ -145,9 +145,7 @@ async def test_plugins(
     monkeypatch.setattr(
         core_lifecycle_td.plugin_manager.updator, "install", mock_install
     )
-    monkeypatch.setattr(
-        core_lifecycle_td.plugin_manager.updator, "update", mock_update
-    )
+    monkeypatch.setattr(core_lifecycle_td.plugin_manager.updator, "update", mock_update)
 
     try:
         # 插件安装
@@ -158,7 +156,9 @@ async def test_plugins(
         )
         assert response.status_code == 200
         data = await response.get_json()
-        assert data["status"] == "ok", f"安装失败: {data.get('message', 'unknown error')}"
+        assert data["status"] == "ok", (
+            f"安装失败: {data.get('message', 'unknown error')}"
+        )
 
         # 验证插件已注册
         exists = any(md.name == test_plugin_name for md in star_registry)
@@ -345,8 +345,15 @@ class _FakeNeoSkills:
         }
 
     async def evaluate_candidate(self, candidate_id: str, **kwargs):
+        if candidate_id == "cand-bad":
+            raise RuntimeError("candidate not found")
         return {"candidate_id": candidate_id, **kwargs}
 
+    async def delete_candidate(self, candidate_id: str, reason=None):
+        if candidate_id == "cand-bad":
+            raise RuntimeError("candidate not found")
+        return {"id": candidate_id, "deleted": True, "reason": reason}
+
     async def promote_candidate(self, candidate_id: str, stage: str = "canary"):
         return {
             "id": "rel-2",
@@ -434,6 +441,15 @@ async def test_neo_skills_routes(
     assert isinstance(data["data"], list)
     assert data["data"][0]["id"] == "rel-1"
 
+    response = await test_client.get(
+        "/api/skills/neo/overview", headers=authenticated_header
+    )
+    assert response.status_code == 200
+    data = await response.get_json()
+    assert data["status"] == "ok"
+    assert data["data"]["candidates"][0]["id"] == "cand-1"
+    assert data["data"]["releases"][0]["id"] == "rel-1"
+
     response = await test_client.get(
         "/api/skills/neo/payload?payload_ref=pref-1", headers=authenticated_header
     )
@@ -463,6 +479,36 @@ async def test_neo_skills_routes(
     assert data["status"] == "ok"
     assert data["data"]["passed"] is False
 
+    response = await test_client.post(
+        "/api/skills/neo/evaluate-batch",
+        json={"ids": ["cand-1", "cand-bad"], "passed": True},
+        headers=authenticated_header,
+    )
+    assert response.status_code == 200
+    data = await response.get_json()
+    assert data["status"] == "ok"
+    assert data["data"]["failed"] == 1
+    results = {item["id"]: item for item in data["data"]["results"]}
+    assert results["cand-1"]["status"] == "ok"
+    assert results["cand-1"]["result"]["passed"] is True
+    assert results["cand-bad"]["status"] == "error"
+    assert "candidate not found" in results["cand-bad"]["message"]
+
+    response = await test_client.post(
+        "/api/skills/neo/delete-candidates-batch",
+        json={"ids": ["cand-1", "cand-bad"], "reason": "cleanup"},
+        headers=authenticated_header,
+    )
+    assert response.status_code == 200
+    data = await response.get_json()
+    assert data["status"] == "ok"
+    assert data["data"]["failed"] == 1
+    results = {item["id"]: item for item in data["data"]["results"]}
+    assert results["cand-1"]["status"] == "ok"
+    assert results["cand-1"]["result"]["deleted"] is True
+    assert results["cand-bad"]["status"] == "error"
+    assert "candidate not found" in results["cand-bad"]["message"]
+
     response = await test_client.post(
         "/api/skills/neo/promote",
         json={"candidate_id": "cand-1", "stage": "stable"},
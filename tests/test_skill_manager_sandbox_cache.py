@@ -26,10 +26,6 @@ def test_list_skills_merges_local_and_sandbox_cache(monkeypatch, tmp_path: Path)
         "astrbot.core.skills.skill_manager.get_astrbot_data_path",
         lambda: str(data_dir),
     )
-    monkeypatch.setattr(
-        "astrbot.core.skills.skill_manager.get_astrbot_temp_path",
-        lambda: str(temp_dir),
-    )
 
     mgr = SkillManager(skills_root=str(skills_root))
     _write_skill(skills_root, "custom-local", "local description")
@@ -74,10 +70,6 @@ def test_sandbox_cached_skill_respects_active_and_display_path(
         "astrbot.core.skills.skill_manager.get_astrbot_data_path",
         lambda: str(data_dir),
     )
-    monkeypatch.setattr(
-        "astrbot.core.skills.skill_manager.get_astrbot_temp_path",
-        lambda: str(temp_dir),
-    )
 
     mgr = SkillManager(skills_root=str(skills_root))
     mgr.set_sandbox_skills_cache(
@@ -101,4 +93,3 @@ def test_sandbox_cached_skill_respects_active_and_display_path(
     mgr.set_skill_active("browser-automation", False)
     active_skills = mgr.list_skills(runtime="sandbox", active_only=True)
     assert active_skills == []
-
@@ -135,10 +135,6 @@ def test_list_skills_parses_description_from_local(monkeypatch, tmp_path: Path):
         "astrbot.core.skills.skill_manager.get_astrbot_data_path",
         lambda: str(data_dir),
     )
-    monkeypatch.setattr(
-        "astrbot.core.skills.skill_manager.get_astrbot_temp_path",
-        lambda: str(temp_dir),
-    )
 
     skill_dir = skills_root / "screencap"
     skill_dir.mkdir()
@@ -164,9 +160,7 @@ def test_list_skills_parses_description_from_local(monkeypatch, tmp_path: Path):
     assert not hasattr(s, "output")
 
 
-def test_list_skills_description_from_sandbox_cache(
-    monkeypatch, tmp_path: Path
-):
+def test_list_skills_description_from_sandbox_cache(monkeypatch, tmp_path: Path):
     data_dir = tmp_path / "data"
     temp_dir = tmp_path / "temp"
     skills_root = tmp_path / "skills"
@@ -178,10 +172,6 @@ def test_list_skills_description_from_sandbox_cache(
         "astrbot.core.skills.skill_manager.get_astrbot_data_path",
         lambda: str(data_dir),
     )
-    monkeypatch.setattr(
-        "astrbot.core.skills.skill_manager.get_astrbot_temp_path",
-        lambda: str(temp_dir),
-    )
 
     mgr = SkillManager(skills_root=str(skills_root))
     mgr.set_sandbox_skills_cache(